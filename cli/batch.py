@@ -0,0 +1,179 @@
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep stdout clean for JSON lines
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Iterator, TextIO
+from core.map_loader import iter_map_files, count_grids, load_grid
+from core.search_planner import SearchPlanner
+from evaluation.report import score_path
+from pathfinder import registry
+
+DEFAULT_CHUNK_SIZE = 64
+MAX_PENDING_PER_WORKER = 4
+
+
+def iter_queries(paths: list[str]) -> Iterator[tuple[str, int]]:
+    """
+    Lazily enumerate (map path, grid index) queries. Only one map file is held in memory at a time.
+    """
+    for path in iter_map_files(paths):
+        for index in range(count_grids(path)):
+            yield path, index
+
+
+def plan_query(
+        path: str,
+        index: int,
+        algorithm: str,
+        step_limit: int,
+        coin_reward: int,
+        trash_reward: int
+) -> dict:
+    """
+    Plan a single query and summarize it as a JSON-serializable dict.
+    """
+    grid = load_grid(path, index)
+    result = {'map': path, 'index': index, 'algorithm': algorithm, 'step_limit': step_limit}
+    if grid.agent_x_y is None or grid.goal_x_y is None:
+        result['error'] = "Map has no agent or goal"
+        return result
+    pathfinder = registry.get_pathfinder(algorithm)(step_limit, coin_reward, trash_reward)
+    planner = SearchPlanner(pathfinder)
+    final_path = planner.plan(grid, grid.agent_x_y, grid.goal_x_y)
+    score, collected = score_path(grid, final_path, coin_reward, trash_reward)
+    result.update({
+        'success': bool(final_path),
+        'steps': max(len(final_path) - 1, 0),
+        'score': score,
+        'collected': collected,
+        'states_explored': pathfinder.states_explored,
+        'compute_time': planner.last_compute_time,
+        'path': final_path
+    })
+    return result
+
+
+def plan_chunk(queries: list[tuple[str, int]], algorithm: str, step_limit: int, *rewards) -> list[dict]:
+    """
+    Plan a chunk of queries in a worker process. A query that raises gets an error result instead of failing the
+    rest of the batch.
+    """
+    results = []
+    for path, index in queries:
+        try:
+            results.append(plan_query(path, index, algorithm, step_limit, *rewards))
+        except Exception as e:
+            results.append({
+                'map': path,
+                'index': index,
+                'algorithm': algorithm,
+                'step_limit': step_limit,
+                'error': str(e)
+            })
+    return results
+
+
+def _chunks(iterable, size: int) -> Iterator[list]:
+    """
+    Split an iterable into lists of at most size items.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def run_batch(
+        paths: list[str],
+        algorithm: str,
+        step_limit: int,
+        coin_reward: int,
+        trash_reward: int,
+        out: TextIO,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    Plan every query in the given maps and stream one JSON line per query to out.
+
+    Results are written in completion order. At most a few chunks per worker are in flight at once, so memory use
+    does not grow with the number of queries.
+
+    :return: Number of results written
+    """
+    registry.get_pathfinder(algorithm)  # Fail fast on unknown algorithms
+    options = (algorithm, step_limit, coin_reward, trash_reward)
+    chunks = _chunks(iter_queries(paths), chunk_size)
+    written = 0
+
+    def write(results: list[dict]) -> None:
+        nonlocal written
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+        written += len(results)
+
+    if workers == 1:
+        for chunk in chunks:
+            write(plan_chunk(chunk, *options))
+        return written
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        max_pending = workers * MAX_PENDING_PER_WORKER
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(plan_chunk, chunk, *options))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    write(future.result())
+        for future in pending:
+            write(future.result())
+    return written
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m cli.batch",
+        description="Plan paths for every grid in one or more map files and write one JSON result per line."
+    )
+    parser.add_argument("maps", nargs="+", help="Map files or directories of map files")
+    parser.add_argument("-a", "--algorithm", default="ASTAR", choices=registry.available(), metavar="NAME",
+                        help="Registered pathfinder name (default: ASTAR)")
+    parser.add_argument("-s", "--step-limit", type=int, default=20, help="Step limit (default: 20)")
+    parser.add_argument("--coin-reward", type=int, default=0, help="Coin reward (default: 0)")
+    parser.add_argument("--trash-reward", type=int, default=0, help="Trash reward (default: 0)")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Queries per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        run_batch(
+            args.maps,
+            args.algorithm,
+            args.step_limit,
+            args.coin_reward,
+            args.trash_reward,
+            out,
+            workers=args.workers,
+            chunk_size=args.chunk_size
+        )
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -7,7 +7,7 @@ from gui.gui_utils import init_pygame
 from enums.game_object import GameObject
 from enums.algorithm import Algorithm
 from core.config import GRID_ROWS, GRID_COLS
-from core.config import AGENT_ORIGIN, DEFAULT_STEP_LIMIT, DEFAULT_ALGO
+from core.config import AGENT_ORIGIN, DEFAULT_STEP_LIMIT, DEFAULT_ALGO, PLAN_TIMEOUT
 from enums.run_state import RunState
 from evaluation.report import Report
 
@@ -33,6 +33,8 @@ class Controller:
         self.selected_algo = DEFAULT_ALGO
         self.pathfinder = DEFAULT_ALGO.get_pathfinder()
         self.grid = Grid(GRID_ROWS, GRID_COLS)
+        # Fronts cover the current step limit only: lower limits are lookups, higher ones extend the front up to them
+        # within PLAN_TIMEOUT
         self.search_planner = SearchPlanner(self.pathfinder(self.step_limit, self.coin_reward, self.trash_reward))
         self.agent = Agent(self.search_planner)
 
@@ -132,9 +134,8 @@ class Controller:
         self.coin_reward = int(self.window.coin_grp_display.value or 0)
         self.trash_reward = int(self.window.trash_grp_display.value or 0)
 
-        pathfinder = self.selected_algo.get_pathfinder()  # New pathfinder to account for change in reward values
-        pathfinder = pathfinder(self.step_limit, self.coin_reward, self.trash_reward)
-        self.search_planner.set_pathfinder(pathfinder)
+        # Keep the pathfinder and its reward-independent preprocessing, only the reward values change
+        self.search_planner.pathfinder.set_rewards(self.coin_reward, self.trash_reward)
         self._handle_change()
 
     def _update_algo(self, selected_algo: Algorithm) -> None:
@@ -178,7 +179,9 @@ class Controller:
         Plan new path.
         """
         if self.grid.agent_x_y and self.grid.goal_x_y:
-            self.path = self.search_planner.plan(self.grid, self.grid.agent_x_y, self.grid.goal_x_y)
+            self.path = self.search_planner.plan(
+                self.grid, self.grid.agent_x_y, self.grid.goal_x_y, timeout=PLAN_TIMEOUT
+            )
             self.step_idx = 0
             self.finished = False
 
@@ -0,0 +1,63 @@
+import numpy as np
+
+UNREACHABLE = np.iinfo(np.int32).max  # Distance to cells that cannot be reached
+
+"""
+Level-synchronous breadth-first search over boolean cell arrays. Frontiers are arrays of flat cell indices, so each
+level is expanded with a handful of vectorized operations instead of one Python iteration per cell.
+
+Directions are ordered as in Grid.get_adjacent: down, up, right, left.
+"""
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def neighbor_candidates(frontier: np.ndarray, rows: int, cols: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the in-bounds neighbors of every frontier cell, in frontier order and then direction order.
+
+    :param frontier: Flat cell indices
+    :return: (neighbors, positions) where positions index the flattened (len(frontier), 4) candidate table, so
+             positions // 4 is the parent's frontier index and positions % 4 is the direction
+    """
+    candidates = np.empty((frontier.size, 4), dtype=np.int64)
+    valid = np.empty((frontier.size, 4), dtype=bool)
+    col = frontier % cols
+    candidates[:, 0] = frontier + cols
+    valid[:, 0] = frontier < (rows - 1) * cols
+    candidates[:, 1] = frontier - cols
+    valid[:, 1] = frontier >= cols
+    candidates[:, 2] = frontier + 1
+    valid[:, 2] = col != cols - 1
+    candidates[:, 3] = frontier - 1
+    valid[:, 3] = col != 0
+    positions = np.flatnonzero(valid.ravel())
+    return candidates.ravel()[positions], positions
+
+
+def bfs_distance_field(
+        walkable: np.ndarray,
+        source: tuple[int, int],
+        max_distance: int | None = None,
+        blocked: tuple[int, int] | None = None
+) -> np.ndarray:
+    """
+    Get the step distance from source to every cell, UNREACHABLE for walls and cells beyond max_distance.
+
+    :param blocked: Cell treated as a wall, for paths that must not pass through it
+    """
+    rows, cols = walkable.shape
+    flat_walkable = walkable.ravel()
+    if blocked is not None:
+        flat_walkable = flat_walkable.copy()
+        flat_walkable[blocked[0] * cols + blocked[1]] = False
+    field = np.full(rows * cols, UNREACHABLE, dtype=np.int32)
+    frontier = np.array([source[0] * cols + source[1]], dtype=np.int64)
+    field[frontier] = 0
+    distance = 0
+    while frontier.size and (max_distance is None or distance < max_distance):
+        distance += 1
+        neighbors, _ = neighbor_candidates(frontier, rows, cols)
+        neighbors = neighbors[flat_walkable[neighbors] & (field[neighbors] == UNREACHABLE)]
+        frontier = np.unique(neighbors)
+        field[frontier] = distance
+    return field.reshape(rows, cols)
@@ -0,0 +1,37 @@
+import threading
+from enums.plan_status import PlanStatus
+
+
+class CancellationToken:
+    """
+    Flag a caller sets, from any thread, to ask running plans to stop.
+    """
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Ask every plan using this token to stop.
+        """
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Determine if cancel has been called.
+        """
+        return self._event.is_set()
+
+
+class SearchInterrupted(Exception):
+    """
+    Raised from a search loop when its plan is cancelled or past its deadline.
+    """
+    def __init__(self, status: PlanStatus, path: list[tuple[int, int]] | None = None):
+        """
+        :param status: Why the search stopped
+        :param path: Best path found before stopping, for searches that have one
+        """
+        super().__init__(status.name)
+        self.status = status
+        self.path = path or []
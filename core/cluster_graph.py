@@ -0,0 +1,190 @@
+from collections import deque
+import numpy as np
+
+"""
+Cells are referred to by flat index (row * cols + col). Within a cluster, BFS trees store for each local cell the
+direction its parent lies in, as an index into DIRECTIONS plus one, with 0 for unvisited cells and the root.
+"""
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+SHORT_ENTRANCE = 6  # Entrances shorter than this get one transition in the middle, longer ones one at each end
+
+
+class ClusterInfo:
+    """
+    Abstract graph nodes of one cluster: its entrance cells, the cells they cross to in neighboring clusters, and
+    step distances between entrances inside the cluster, with the BFS tree from each entrance for refinement.
+    """
+    def __init__(self, crossings: dict[int, list[int]]):
+        self.crossings = crossings
+        self.edges: dict[int, list[tuple[int, int]]] = {}
+        self.trees: dict[int, bytearray] = {}
+
+
+class ClusterGraph:
+    """
+    Abstract graph for hierarchical pathfinding (HPA*). The grid is split into square clusters. Where walkable cells
+    face each other across a cluster border, entrance cells are linked by a one-step crossing, and entrances of the
+    same cluster are linked by their step distance inside it.
+
+    Clusters are built on first use and cached. Changing a cell drops only its own cluster and, for cells on a
+    border, the neighbor across it.
+    """
+    def __init__(self, walkable: np.ndarray, cluster_size: int):
+        self.walkable = walkable.copy()
+        self.rows, self.cols = walkable.shape
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+        self._borders: dict[tuple[int, str], list[tuple[int, int]]] = {}
+        self._clusters: dict[int, ClusterInfo] = {}
+
+    def cluster_of(self, cell: int) -> int:
+        """
+        Get the id of the cluster holding a flat cell index.
+        """
+        row, col = divmod(cell, self.cols)
+        return (row // self.cluster_size) * self.cluster_cols + col // self.cluster_size
+
+    def bounds(self, cluster: int) -> tuple[int, int, int, int]:
+        """
+        Get (top, left, bottom, right) of a cluster, bottom and right exclusive.
+        """
+        cluster_row, cluster_col = divmod(cluster, self.cluster_cols)
+        top, left = cluster_row * self.cluster_size, cluster_col * self.cluster_size
+        return top, left, min(top + self.cluster_size, self.rows), min(left + self.cluster_size, self.cols)
+
+    def set_walkable(self, row: int, col: int, walkable: bool) -> None:
+        """
+        Update a cell, dropping the cached clusters and borders it affects.
+        """
+        if self.walkable[row, col] == walkable:
+            return
+        self.walkable[row, col] = walkable
+        size = self.cluster_size
+        cluster = (row // size) * self.cluster_cols + col // size
+        self._clusters.pop(cluster, None)
+        neighbors = []
+        if row % size == size - 1 and row + 1 < self.rows:
+            neighbors.append(((cluster, "down"), cluster + self.cluster_cols))
+        if row % size == 0 and row > 0:
+            neighbors.append(((cluster - self.cluster_cols, "down"), cluster - self.cluster_cols))
+        if col % size == size - 1 and col + 1 < self.cols:
+            neighbors.append(((cluster, "right"), cluster + 1))
+        if col % size == 0 and col > 0:
+            neighbors.append(((cluster - 1, "right"), cluster - 1))
+        for border, neighbor in neighbors:
+            self._borders.pop(border, None)
+            self._clusters.pop(neighbor, None)
+
+    def _border(self, cluster: int, side: str) -> list[tuple[int, int]]:
+        """
+        Get the transitions across the bottom ("down") or right ("right") border of a cluster as (inside, outside)
+        flat cell pairs.
+        """
+        key = (cluster, side)
+        transitions = self._borders.get(key)
+        if transitions is None:
+            top, left, bottom, right = self.bounds(cluster)
+            if side == "down":
+                line = (self.walkable[bottom - 1, left:right] & self.walkable[bottom, left:right]).tolist()
+                inside, step, outside = (bottom - 1) * self.cols + left, 1, bottom * self.cols + left
+            else:
+                line = (self.walkable[top:bottom, right - 1] & self.walkable[top:bottom, right]).tolist()
+                inside, step, outside = top * self.cols + right - 1, self.cols, top * self.cols + right
+            transitions = []
+            start = None
+            for i, is_open in enumerate(line + [False]):
+                if is_open and start is None:
+                    start = i
+                elif not is_open and start is not None:
+                    length = i - start
+                    offsets = [start + length // 2] if length < SHORT_ENTRANCE else [start, i - 1]
+                    transitions.extend((inside + offset * step, outside + offset * step) for offset in offsets)
+                    start = None
+            self._borders[key] = transitions
+        return transitions
+
+    def cluster(self, cluster: int) -> ClusterInfo:
+        """
+        Get the abstract graph nodes of a cluster, building them if the cluster is not cached.
+        """
+        info = self._clusters.get(cluster)
+        if info is None:
+            cluster_row, cluster_col = divmod(cluster, self.cluster_cols)
+            crossings: dict[int, list[int]] = {}
+            if cluster_row + 1 < self.cluster_rows:
+                for inside, outside in self._border(cluster, "down"):
+                    crossings.setdefault(inside, []).append(outside)
+            if cluster_col + 1 < self.cluster_cols:
+                for inside, outside in self._border(cluster, "right"):
+                    crossings.setdefault(inside, []).append(outside)
+            if cluster_row > 0:
+                for outside, inside in self._border(cluster - self.cluster_cols, "down"):
+                    crossings.setdefault(inside, []).append(outside)
+            if cluster_col > 0:
+                for outside, inside in self._border(cluster - 1, "right"):
+                    crossings.setdefault(inside, []).append(outside)
+            info = ClusterInfo(crossings)
+            local = {entrance: self.local_index(entrance, cluster) for entrance in crossings}
+            for entrance in crossings:
+                distance, tree = self.local_search(entrance)
+                info.trees[entrance] = tree
+                info.edges[entrance] = [
+                    (other, distance[local[other]]) for other in crossings
+                    if other != entrance and distance[local[other]] >= 0
+                ]
+            self._clusters[cluster] = info
+        return info
+
+    def local_index(self, cell: int, cluster: int) -> int:
+        """
+        Get the index of a flat cell within its cluster's local arrays.
+        """
+        top, left, _, right = self.bounds(cluster)
+        row, col = divmod(cell, self.cols)
+        return (row - top) * (right - left) + col - left
+
+    def local_search(self, source: int) -> tuple[list[int], bytearray]:
+        """
+        Breadth-first search from a cell without leaving its cluster.
+
+        :return: (distance, tree) over the cluster's local cells, where distance is -1 for cells not reached
+        """
+        cluster = self.cluster_of(source)
+        top, left, bottom, right = self.bounds(cluster)
+        height, width = bottom - top, right - left
+        walkable = self.walkable[top:bottom, left:right].tobytes()
+        tree = bytearray(height * width)
+        distance = [-1] * (height * width)
+        root = self.local_index(source, cluster)
+        distance[root] = 0
+        queue = deque([root])
+        while queue:
+            local = queue.popleft()
+            row, col = divmod(local, width)
+            for direction, (dr, dc) in enumerate(DIRECTIONS):
+                nr, nc = row + dr, col + dc
+                if 0 <= nr < height and 0 <= nc < width:
+                    neighbor = nr * width + nc
+                    if walkable[neighbor] and distance[neighbor] < 0:
+                        distance[neighbor] = distance[local] + 1
+                        tree[neighbor] = direction + 1
+                        queue.append(neighbor)
+        return distance, tree
+
+    def tree_path(self, tree: bytearray, cluster: int, target: int) -> list[tuple[int, int]]:
+        """
+        Follow a cluster BFS tree from target back to its root.
+
+        :return: (row, col) cells from the root to target
+        """
+        top, left, bottom, right = self.bounds(cluster)
+        width = right - left
+        row, col = divmod(target, self.cols)
+        row, col = row - top, col - left
+        path = [(row + top, col + left)]
+        while tree[row * width + col]:
+            dr, dc = DIRECTIONS[tree[row * width + col] - 1]
+            row, col = row - dr, col - dc
+            path.append((row + top, col + left))
+        return list(reversed(path))
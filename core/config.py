@@ -27,3 +27,4 @@ Defaults
 """
 DEFAULT_STEP_LIMIT = 20
 DEFAULT_ALGO = Algorithm.ASTAR
+PLAN_TIMEOUT = 2.0  # Seconds a replan may take, so raising the step limit cannot stall the GUI
@@ -0,0 +1,124 @@
+import numpy as np
+
+NO_COMPONENT = -1  # Label of wall cells
+
+
+class ConnectivityIndex:
+    """
+    Connected-component labels for the walkable cells of a grid, kept in a union-find over horizontal runs of
+    walkable cells.
+
+    Removing a wall is repaired incrementally by unioning the opened cell with its neighbors. Adding a wall can split
+    a component, which union-find cannot undo, so the index is rebuilt the next time it is queried.
+    """
+    def __init__(self, walkable: np.ndarray):
+        self.walkable = walkable.copy()
+        self.rows, self.cols = walkable.shape
+        self.run_ids = np.full(walkable.shape, NO_COMPONENT, dtype=np.int32)
+        self.parent: list[int] = []
+        self.dirty = True
+
+    def _find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # Path halving
+            x = parent[x]
+        return x
+
+    def _union(self, a: int, b: int) -> None:
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            if ra < rb:
+                ra, rb = rb, ra
+            self.parent[ra] = rb
+
+    def _build(self) -> None:
+        """
+        Label horizontal runs of walkable cells, then union runs that touch vertically.
+        """
+        walkable = self.walkable
+        run_starts = walkable.copy()
+        run_starts[:, 1:] &= ~walkable[:, :-1]  # A run starts at a walkable cell with no walkable cell to its left
+        run_ids = np.cumsum(run_starts.ravel(), dtype=np.int64).reshape(walkable.shape) - 1
+        self.run_ids = np.where(walkable, run_ids, NO_COMPONENT).astype(np.int32)
+        self.parent = list(range(int(run_starts.sum())))
+        touching = walkable[:-1] & walkable[1:]
+        if touching.any():
+            n_runs = np.int64(len(self.parent))
+            pairs = self.run_ids[:-1][touching].astype(np.int64) * n_runs + self.run_ids[1:][touching]
+            pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]  # Runs touch along many columns
+            for pair in np.unique(pairs).tolist():
+                self._union(*divmod(pair, int(n_runs)))
+        self.dirty = False
+
+    def open_cell(self, row: int, col: int) -> None:
+        """
+        Mark a cell walkable and merge it with its walkable neighbors.
+        """
+        if self.walkable[row, col]:
+            return
+        self.walkable[row, col] = True
+        if self.dirty:
+            return
+        run_id = len(self.parent)
+        self.parent.append(run_id)
+        self.run_ids[row, col] = run_id
+        for ar, ac in ((row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)):
+            if 0 <= ar < self.rows and 0 <= ac < self.cols and self.walkable[ar, ac]:
+                self._union(run_id, int(self.run_ids[ar, ac]))
+
+    def close_cell(self, row: int, col: int) -> None:
+        """
+        Mark a cell as a wall. If that could split its component, the labels are rebuilt on the next query.
+        """
+        if not self.walkable[row, col]:
+            return
+        self.walkable[row, col] = False
+        if self.dirty:
+            return
+        if self._ring_neighbor_groups(row, col) <= 1:  # Neighbors stay connected around the cell
+            self.run_ids[row, col] = NO_COMPONENT
+        else:
+            self.dirty = True
+
+    def _ring_neighbor_groups(self, row: int, col: int) -> int:
+        """
+        Count groups of walkable cells in the 8 cells around (row, col) that hold an edge neighbor, where ring cells
+        are grouped if they are consecutive around the ring. One group means the neighbors are joined without the
+        center cell.
+        """
+        ring = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]  # Edge cells at even indices
+        open_ring = [
+            0 <= row + dr < self.rows and 0 <= col + dc < self.cols and bool(self.walkable[row + dr, col + dc])
+            for dr, dc in ring
+        ]
+        if all(open_ring):
+            return 1
+        start = open_ring.index(False)  # Rotate so no group wraps around the end
+        groups = 0
+        in_group = has_edge = False
+        for i in range(start, start + 9):
+            k = i % 8
+            if open_ring[k]:
+                in_group = True
+                has_edge |= k % 2 == 0
+            elif in_group:
+                groups += has_edge
+                in_group = has_edge = False
+        return groups
+
+    def component(self, pos: tuple[int, int]) -> int:
+        """
+        Get the component label of a cell, or NO_COMPONENT for walls.
+        """
+        if self.dirty:
+            self._build()
+        run_id = int(self.run_ids[pos])
+        return self._find(run_id) if run_id != NO_COMPONENT else NO_COMPONENT
+
+    def connected(self, a: tuple[int, int], b: tuple[int, int]) -> bool:
+        """
+        Determine if a path of walkable cells joins a and b.
+        """
+        component = self.component(a)
+        return component != NO_COMPONENT and component == self.component(b)
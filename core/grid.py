@@ -1,18 +1,167 @@
 import numpy as np
 from enums.game_object import GameObject
+from core.connectivity import ConnectivityIndex
+from core.cluster_graph import ClusterGraph
 from collections import Counter
 
+"""
+Cell codes. The grid is backed by a uint8 array of codes so it can live in shared memory or a memory-mapped file.
+"""
+GAME_OBJECTS: tuple[GameObject, ...] = tuple(GameObject)
+CELL_CODES: dict[GameObject, int] = {game_object: code for code, game_object in enumerate(GAME_OBJECTS)}
+EMPTY_CODE = CELL_CODES[GameObject.EMPTY]
+WALL_CODE = CELL_CODES[GameObject.WALL]
+ITEM_CODES = (CELL_CODES[GameObject.COIN], CELL_CODES[GameObject.TRASH])
+NO_ITEM = -1  # Item number of cells without a coin or trash
+
+"""
+Zobrist-style content hashing. Each (cell, code) pair gets a pseudo-random 64-bit key from splitmix64, so no key table
+is stored, and empty cells have key 0 so an empty grid hashes to 0.
+"""
+HASH_MASK = (1 << 64) - 1
+
+
+def _cell_key(index: int, code: int) -> int:
+    """
+    Get the 64-bit hash key for a code at a flat cell index.
+    """
+    if code == EMPTY_CODE:
+        return 0
+    z = (index * 8 + code + 0x9E3779B97F4A7C15) & HASH_MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & HASH_MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & HASH_MASK
+    return z ^ (z >> 31)
+
+
+def _cells_hash(cells: np.ndarray) -> int:
+    """
+    Hash every non-empty cell at once. Matches XOR-ing _cell_key over the grid.
+    """
+    flat = cells.ravel()
+    index = np.flatnonzero(flat != EMPTY_CODE).astype(np.uint64)
+    if not index.size:
+        return 0
+    z = index * np.uint64(8) + flat[index].astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    return int(np.bitwise_xor.reduce(z))
+
 
 class Grid:
     """
     Game grid.
     """
-    def __init__(self, rows, cols):
+    def __init__(self, rows, cols, cells: np.ndarray | None = None):
         self.rows = rows
         self.cols = cols
-        self.grid = np.full((rows, cols), GameObject.EMPTY)
+        self.cells = cells if cells is not None else np.full((rows, cols), EMPTY_CODE, dtype=np.uint8)
         self.agent_x_y = None
         self.goal_x_y = None
+        self.handle = None  # Set when the cells live in shared memory or a memory-mapped file
+        self._shm = None
+        self._owns_shm = False
+        self._hash = None
+        self._analysis = None  # Reward-independent preprocessing, see core.grid_analysis
+        self._connectivity = None
+        self._item_index = None
+        self._cluster_graph = None
+
+    def __reduce__(self):
+        """
+        Pickle shared grids as their handle so workers attach to the same cells instead of copying them.
+        """
+        if self.handle is not None:
+            return self.handle.attach, (self.agent_x_y, self.goal_x_y)
+        return super().__reduce__()
+
+    @property
+    def content_hash(self) -> int:
+        """
+        64-bit hash of the grid contents, updated incrementally as cells change. Computing it scans every cell. Call
+        invalidate() after writes that bypass this Grid, such as another process writing shared cells.
+        """
+        if self._hash is None:
+            self._hash = _cells_hash(self.cells)
+        return self._hash
+
+    @property
+    def layout_hash(self) -> int:
+        """
+        Content hash with the agent and goal cells treated as empty. Moving the agent or goal does not change it.
+        """
+        layout_hash = self.content_hash
+        for pos, game_object in ((self.agent_x_y, GameObject.AGENT), (self.goal_x_y, GameObject.GOAL)):
+            if pos is not None and self.cells[pos] == CELL_CODES[game_object]:
+                layout_hash ^= _cell_key(pos[0] * self.cols + pos[1], CELL_CODES[game_object])
+        return layout_hash
+
+    @property
+    def connectivity(self) -> ConnectivityIndex:
+        """
+        Connected-component labels of walkable cells, maintained as walls change.
+        """
+        if self._connectivity is None:
+            self._connectivity = ConnectivityIndex(self.cells != WALL_CODE)
+        return self._connectivity
+
+    @property
+    def item_index(self) -> np.ndarray:
+        """
+        Item number of every cell, numbering coin and trash cells in row-major order, or NO_ITEM for other cells.
+        Renumbered when an item is added or removed.
+        """
+        if self._item_index is None:
+            is_item = np.isin(self.cells, ITEM_CODES)
+            item_index = np.full(self.cells.shape, NO_ITEM, dtype=np.int32)
+            item_index[is_item] = np.arange(np.count_nonzero(is_item), dtype=np.int32)
+            self._item_index = item_index
+        return self._item_index
+
+    def cluster_graph(self, cluster_size: int) -> ClusterGraph:
+        """
+        Abstract graph over square clusters of the given size, updated cluster by cluster as walls change.
+        """
+        if self._cluster_graph is None or self._cluster_graph.cluster_size != cluster_size:
+            self._cluster_graph = ClusterGraph(self.cells != WALL_CODE, cluster_size)
+        return self._cluster_graph
+
+    def connected(self, a: tuple[int, int], b: tuple[int, int]) -> bool:
+        """
+        Determine if a path of walkable cells joins a and b.
+        """
+        return self.connectivity.connected(a, b)
+
+    def invalidate(self) -> None:
+        """
+        Drop the content hash, connectivity labels, cluster graph and item index, so they are rebuilt from the cells
+        on next use. Plans and analyses cached for the old contents stop matching the new hash.
+        """
+        self._hash = None
+        self._connectivity = None
+        self._cluster_graph = None
+        self._item_index = None
+
+    def _write(self, row: int, col: int, code: int) -> None:
+        """
+        Write a cell code, keeping the content hash, connectivity labels, cluster graph and item index up to date.
+        """
+        old = int(self.cells[row, col])
+        if self._hash is not None:
+            index = row * self.cols + col
+            self._hash ^= _cell_key(index, old) ^ _cell_key(index, code)
+        if self._connectivity is not None:
+            if code == WALL_CODE and old != WALL_CODE:
+                self._connectivity.close_cell(row, col)
+            elif old == WALL_CODE and code != WALL_CODE:
+                self._connectivity.open_cell(row, col)
+        if self._cluster_graph is not None and (old == WALL_CODE) != (code == WALL_CODE):
+            self._cluster_graph.set_walkable(row, col, code != WALL_CODE)
+        if self._item_index is not None and (old in ITEM_CODES) != (code in ITEM_CODES):
+            self._item_index = None
+        if self.handle is not None and self.handle.mode == 'c':  # Copy-on-write edits exist only in this process
+            self.handle = None
+        self.cells[row, col] = code
 
     def in_bounds(self, row: int, col: int) -> bool:
         """
@@ -24,37 +173,37 @@ class Grid:
         """
         Makes walled cells impassible.
         """
-        return self.in_bounds(row, col) and self.grid[row, col] != GameObject.WALL
+        return self.in_bounds(row, col) and self.cells[row, col] != WALL_CODE
 
     def set_agent(self, row: int, col: int) -> None:
         """
         Set agent position in grid.
         """
         if self.agent_x_y:
-            self.grid[self.agent_x_y] = GameObject.EMPTY
+            self._write(*self.agent_x_y, EMPTY_CODE)
         self.agent_x_y = (row, col)
-        self.grid[row, col] = GameObject.AGENT
+        self._write(row, col, CELL_CODES[GameObject.AGENT])
 
     def set_goal(self, row: int, col: int) -> None:
         """
         Set goal position in grid.
         """
         if self.goal_x_y:
-            self.grid[self.goal_x_y] = GameObject.EMPTY
+            self._write(*self.goal_x_y, EMPTY_CODE)
         self.goal_x_y = (row, col)
-        self.grid[self.goal_x_y] = GameObject.GOAL
+        self._write(row, col, CELL_CODES[GameObject.GOAL])
 
     def get_cell_type(self, row: int, col: int) -> GameObject:
         """
         Get game object from cell.
         """
-        return self.grid[row, col]
+        return GAME_OBJECTS[self.cells[row, col]]
 
     def set_cell_type(self, row: int, col: int, game_object: GameObject) -> None:
         """
         Set game object in cell.
         """
-        self.grid[row, col] = game_object
+        self._write(row, col, CELL_CODES[game_object])
 
     def get_adjacent(self, row: int, col: int) -> list[tuple[int, int]]:
         """
@@ -71,7 +220,11 @@ class Grid:
         """
         Remove all game object from grid.
         """
-        self.grid[:] = GameObject.EMPTY
+        self.cells[:] = EMPTY_CODE
+        self._hash = 0
+        self._connectivity = None
+        self._item_index = None
+        self._cluster_graph = None
         self.agent_x_y = None
         self.goal_x_y = None
 
@@ -79,9 +232,5 @@ class Grid:
         """
         Get count of game objects on the grid.
         """
-        counter = Counter()
-        for row in self.grid:
-            for cell in row:
-                if cell in GameObject:
-                    counter[cell] += 1
-        return counter
+        counts = np.bincount(self.cells.ravel(), minlength=len(GAME_OBJECTS))
+        return Counter({GAME_OBJECTS[code]: int(n) for code, n in enumerate(counts) if n})
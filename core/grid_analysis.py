@@ -0,0 +1,132 @@
+import numpy as np
+from core.bitboard import UNREACHABLE, bfs_distance_field
+from core.grid import Grid, WALL_CODE, NO_ITEM
+from core.heuristic import heuristic_table
+from enums.game_object import GameObject
+
+MAX_DISTANCE_FIELDS = 64  # Distance fields kept per layout
+MAX_HEURISTIC_TABLES = 16  # Heuristic tables kept per layout
+MAX_HEURISTIC_CELLS = 1 << 23  # Heuristic table cells kept per layout, so large grids keep fewer tables
+
+
+class TableRows(dict):
+    """
+    Rows of a table as lists, keyed by row number. Each row is converted the first time it is read, so a search near
+    its goal on a large grid converts only the rows it visits.
+    """
+    def __init__(self, table: np.ndarray):
+        super().__init__()
+        self.table = table
+
+    def __missing__(self, row: int) -> list:
+        values = self[row] = self.table[row].tolist()
+        return values
+
+
+class GridAnalysis:
+    """
+    Reward-independent preprocessing of a grid layout: walkable cells, item cells, distance fields and item-to-item
+    distances. None of it depends on coin or trash reward values, so it is computed once per layout and reused across
+    reward changes, step limit changes and agent moves.
+    """
+    def __init__(self, grid: Grid):
+        self.rows = grid.rows
+        self.cols = grid.cols
+        self.layout_hash = grid.layout_hash
+        self.walkable = grid.cells != WALL_CODE
+        item_cells = np.flatnonzero(grid.item_index.ravel() != NO_ITEM)  # In item number order
+        self.items: list[tuple[int, int]] = [divmod(int(i), self.cols) for i in item_cells]
+        self.item_types: list[GameObject] = [grid.get_cell_type(*item) for item in self.items]
+        self.connectivity = grid.connectivity
+        self.item_components: list[int] = [self.connectivity.component(item) for item in self.items]
+        self._distance_fields: dict[tuple, np.ndarray] = {}
+        self._item_distances: np.ndarray | None = None
+        self._heuristic_tables: dict[tuple, tuple[np.ndarray, TableRows]] = {}
+
+    @classmethod
+    def for_grid(cls, grid: Grid) -> "GridAnalysis":
+        """
+        Get the analysis of a grid's current layout, reusing the cached analysis if the layout has not changed.
+        """
+        analysis = grid._analysis
+        if analysis is None or analysis.layout_hash != grid.layout_hash or analysis.rows != grid.rows:
+            analysis = cls(grid)
+            grid._analysis = analysis
+        return analysis
+
+    def distance_field(self, source: tuple[int, int], blocked: tuple[int, int] | None = None) -> np.ndarray:
+        """
+        Get the step distance from source to every cell, UNREACHABLE for walls and cut-off cells.
+
+        :param blocked: Cell the paths may not pass through, such as the goal, which ends every path
+        """
+        key = (source, blocked)
+        field = self._distance_fields.get(key)
+        if field is None:
+            field = bfs_distance_field(self.walkable, source, blocked=blocked)
+            if len(self._distance_fields) >= MAX_DISTANCE_FIELDS:
+                del self._distance_fields[next(iter(self._distance_fields))]  # Drop the oldest field
+            self._distance_fields[key] = field
+        return field
+
+    def distance(self, a: tuple[int, int], b: tuple[int, int]) -> int:
+        """
+        Get the step distance between two cells.
+        """
+        return int(self.distance_field(b)[a])
+
+    def heuristic_table(self, heuristic, goal: tuple[int, int]) -> np.ndarray:
+        """
+        Get heuristic(cell, goal) for every cell, computed once per heuristic and goal.
+        """
+        return self._heuristic_entry(heuristic, goal)[0]
+
+    def heuristic_rows(self, heuristic, goal: tuple[int, int]) -> TableRows:
+        """
+        Get the heuristic table as rows of lists. Search loops index these as rows[r][c], which is faster from Python
+        than indexing the array or calling the heuristic.
+        """
+        return self._heuristic_entry(heuristic, goal)[1]
+
+    def _heuristic_entry(self, heuristic, goal: tuple[int, int]) -> tuple[np.ndarray, TableRows]:
+        """
+        Get the cached (table, rows) pair for a heuristic and goal, computing it if needed.
+        """
+        key = (heuristic, goal)
+        entry = self._heuristic_tables.get(key)
+        if entry is None:
+            table = heuristic_table(heuristic, goal, self.rows, self.cols)
+            max_tables = max(min(MAX_HEURISTIC_TABLES, MAX_HEURISTIC_CELLS // table.size), 1)
+            while len(self._heuristic_tables) >= max_tables:
+                del self._heuristic_tables[next(iter(self._heuristic_tables))]  # Drop the oldest table
+            entry = self._heuristic_tables[key] = (table, TableRows(table))
+        return entry
+
+    def item_distances(self) -> np.ndarray:
+        """
+        Get the matrix of step distances between every pair of items, indexed by item number.
+        """
+        if self._item_distances is None:
+            n = len(self.items)
+            matrix = np.full((n, n), UNREACHABLE, dtype=np.int32)
+            if n:
+                item_rows, item_cols = np.array(self.items).T
+                for i, item in enumerate(self.items):
+                    matrix[i] = self.distance_field(item)[item_rows, item_cols]
+            self._item_distances = matrix
+        return self._item_distances
+
+    def reachable_items(self, start: tuple[int, int], goal: tuple[int, int], step_limit: int) -> list[int]:
+        """
+        Get the item numbers that a path from start to goal can collect within step_limit. Paths end at the goal, so
+        they reach items without passing through it.
+        """
+        if start == goal:
+            return []
+        component = self.connectivity.component(start)
+        candidates = [i for i, item_component in enumerate(self.item_components) if item_component == component]
+        if not candidates or not self.connectivity.connected(start, goal):  # Skip items in other components
+            return []
+        from_start = self.distance_field(start, blocked=goal)
+        to_goal = self.distance_field(goal)
+        return [i for i in candidates if int(from_start[self.items[i]]) + int(to_goal[self.items[i]]) <= step_limit]
@@ -0,0 +1,20 @@
+import numpy as np
+
+
+def manhattan(a: tuple[int, int], b: tuple[int, int]) -> int:
+    """
+    Returns Manhattan distance between a and b.
+    """
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def heuristic_table(heuristic, goal: tuple[int, int], rows: int, cols: int) -> np.ndarray:
+    """
+    Materialize heuristic(cell, goal) for every cell as a (rows, cols) array.
+
+    Manhattan distance is computed with NumPy. Other heuristics are called once per cell.
+    """
+    if heuristic is manhattan:
+        return np.abs(np.arange(rows) - goal[0])[:, None] + np.abs(np.arange(cols) - goal[1])[None, :]
+    values = [heuristic((r, c), goal) for r in range(rows) for c in range(cols)]
+    return np.array(values).reshape(rows, cols)
@@ -0,0 +1,181 @@
+import os
+import struct
+import numpy as np
+from core.grid import Grid, EMPTY_CODE, WALL_CODE, ITEM_CODES, NO_ITEM
+from core.shared_grid import SharedGridHandle
+
+"""
+Binary map format (.grmap), little-endian:
+
+    header   magic b"GRMP", version u16, reserved u16, rows u32, cols u32,
+             agent row/col i32, goal row/col i32 (-1 when unset),
+             item count u64, cells offset u64, items offset u64
+    cells    rows * cols uint8 cell codes (core.grid.CELL_CODES), row-major, 64-byte aligned
+    items    item count uint64 flat cell indices of coins and trash, ascending, 64-byte aligned. An items offset of 0
+             means the list is not stored: opening a map for writing clears it, since edits may add or remove items.
+
+Cells are stored exactly as Grid keeps them in memory, so a loaded map is a memory map of the file and only the pages a
+search touches are read from disk.
+"""
+MAGIC = b"GRMP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIiiiiQQQ")
+ALIGNMENT = 64
+ITEMS_OFFSET_AT = HEADER.size - 8  # Byte position of the items offset in the header
+
+"""
+ASCII grid-benchmark maps (.map): a 'type', 'height' and 'width' header, a 'map' line, then one character per cell.
+Their scenario files (.scen) start with a 'version' line, then hold one query per line:
+
+    bucket  map path  map width  map height  start x  start y  goal x  goal y  optimal length
+
+Columns are tab-separated and x is the column, y the row.
+"""
+ASCII_BLOCKED = b"@OTW"
+SCENARIO_FIELDS = 9
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def read_header(path: str) -> dict:
+    """
+    Read and validate a map file header.
+    """
+    with open(path, 'rb') as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"'{path}' is not a map file: header is truncated")
+    (magic, version, _, rows, cols, agent_r, agent_c, goal_r, goal_c,
+     item_count, cells_offset, items_offset) = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError(f"'{path}' is not a map file: bad magic {magic!r}")
+    if version != VERSION:
+        raise ValueError(f"'{path}' has unsupported map version {version}")
+    return {
+        'rows': rows,
+        'cols': cols,
+        'agent': (agent_r, agent_c) if agent_r >= 0 else None,
+        'goal': (goal_r, goal_c) if goal_r >= 0 else None,
+        'item_count': item_count,
+        'cells_offset': cells_offset,
+        'items_offset': items_offset
+    }
+
+
+def save_map(grid: Grid, path: str) -> None:
+    """
+    Write a grid to a binary map file.
+    """
+    cells = np.ascontiguousarray(grid.cells, dtype=np.uint8)
+    items = np.flatnonzero(np.isin(cells, ITEM_CODES)).astype('<u8')
+    cells_offset = _align(HEADER.size)
+    items_offset = _align(cells_offset + cells.nbytes)
+    agent = grid.agent_x_y or (-1, -1)
+    goal = grid.goal_x_y or (-1, -1)
+    header = HEADER.pack(
+        MAGIC, VERSION, 0, grid.rows, grid.cols, *agent, *goal, len(items), cells_offset, items_offset
+    )
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.seek(cells_offset)
+        cells.tofile(f)
+        f.seek(items_offset)
+        items.tofile(f)
+
+
+def load_map(path: str, mode: str = 'c') -> Grid:
+    """
+    Open a binary map file as a Grid backed by a memory map of its cells.
+
+    :param path: Map file path
+    :param mode: numpy.memmap mode. The default 'c' is copy-on-write: edits stay in memory and the file is untouched,
+                 so the first edit drops the grid's handle and it pickles as a copy of its cells. Use 'r+' to write
+                 edits through to the file; this clears the file's item list until it is saved again with save_map.
+    """
+    header = read_header(path)
+    rows, cols = header['rows'], header['cols']
+    items = load_item_index(path)
+    if mode == 'r+' and items is not None:  # Edits written through to the file would leave the item list stale
+        items = None
+        with open(path, 'r+b') as f:
+            f.seek(ITEMS_OFFSET_AT)
+            f.write(struct.pack('<Q', 0))
+    cells = np.memmap(path, dtype=np.uint8, mode=mode, offset=header['cells_offset'], shape=(rows, cols))
+    grid = Grid(rows, cols, cells=cells)
+    grid.agent_x_y = header['agent']
+    grid.goal_x_y = header['goal']
+    grid.handle = SharedGridHandle(rows, cols, path=path, offset=header['cells_offset'], mode=mode)
+    if items is not None:  # Saves scanning every cell for items
+        item_index = np.full((rows, cols), NO_ITEM, dtype=np.int32)
+        item_index.ravel()[items] = np.arange(len(items), dtype=np.int32)  # Row-major numbering, as Grid uses
+        grid._item_index = item_index
+    return grid
+
+
+def load_item_index(path: str) -> np.ndarray | None:
+    """
+    Get the memory-mapped flat indices of every coin and trash cell in a map file, or None if it does not store them.
+    """
+    header = read_header(path)
+    if not header['items_offset']:
+        return None
+    if not header['item_count']:
+        return np.empty(0, dtype='<u8')
+    return np.memmap(path, dtype='<u8', mode='r', offset=header['items_offset'], shape=(header['item_count'],))
+
+
+def import_ascii_map(path: str) -> Grid:
+    """
+    Import an ASCII grid-benchmark map. Blocked terrain becomes walls and everything else is empty.
+    """
+    with open(path, 'rb') as f:
+        header = {}
+        for line in f:
+            line = line.strip()
+            if line == b"map":
+                break
+            key, _, value = line.partition(b" ")
+            header[key.decode()] = value.decode()
+        rows, cols = int(header['height']), int(header['width'])
+        data = np.frombuffer(f.read(), dtype=np.uint8)
+    data = data[(data != ord("\n")) & (data != ord("\r"))]
+    if data.size < rows * cols:
+        raise ValueError(f"'{path}' has {data.size} cells, expected {rows * cols}")
+    lookup = np.full(256, EMPTY_CODE, dtype=np.uint8)
+    lookup[np.frombuffer(ASCII_BLOCKED, dtype=np.uint8)] = WALL_CODE
+    return Grid(rows, cols, cells=lookup[data[:rows * cols]].reshape(rows, cols))
+
+
+def read_scenarios(path: str) -> list[tuple[str, tuple[int, int], tuple[int, int]]]:
+    """
+    Read the queries in a grid-benchmark scenario file.
+
+    :return: (map path, start, goal) per query, with map paths resolved against the scenario file's directory and
+             start and goal as (row, col)
+    """
+    directory = os.path.dirname(path)
+    scenarios = []
+    with open(path, 'r') as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip() or line.startswith("version"):
+                continue
+            fields = line.rstrip("\r\n").split("\t")
+            if len(fields) != SCENARIO_FIELDS:
+                fields = line.split()
+            if len(fields) != SCENARIO_FIELDS:
+                raise ValueError(f"'{path}' line {number} has {len(fields)} fields, expected {SCENARIO_FIELDS}")
+            start_x, start_y, goal_x, goal_y = (int(field) for field in fields[4:8])
+            map_path = os.path.join(directory, fields[1])
+            if not os.path.exists(map_path):  # Scenarios often name the map relative to a benchmark root
+                map_path = os.path.join(directory, os.path.basename(fields[1]))
+            scenarios.append((map_path, (start_y, start_x), (goal_y, goal_x)))
+    return scenarios
+
+
+def convert_ascii_map(src: str, dst: str) -> None:
+    """
+    Convert an ASCII grid-benchmark map to a binary map file.
+    """
+    save_map(import_ascii_map(src), dst)
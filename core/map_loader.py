@@ -0,0 +1,138 @@
+import json
+import os
+import numpy as np
+from functools import lru_cache
+from typing import Iterator
+from core.grid import Grid
+from core.map_format import load_map, import_ascii_map, read_scenarios
+from enums.game_object import GameObject
+from evaluation.report import GAME_OBJECT_CODE
+
+CODE_GAME_OBJECT = {code: game_object for game_object, code in GAME_OBJECT_CODE.items()}
+
+JSON_EXTENSION = ".json"
+BINARY_EXTENSION = ".grmap"
+ASCII_EXTENSION = ".map"
+SCENARIO_EXTENSION = ".scen"
+MAP_EXTENSIONS = (JSON_EXTENSION, BINARY_EXTENSION, SCENARIO_EXTENSION)  # ASCII maps are planned through scenarios
+
+
+def decode_grid(rows: list[list[str]] | list[str]) -> Grid:
+    """
+    Build a Grid from rows of game object codes, as written by Report.
+
+    :param rows: Rows of codes, either lists of single codes or strings such as "A_WC"
+    :return: Grid with agent and goal set from the 'A' and 'G' cells
+    """
+    grid = Grid(len(rows), len(rows[0]) if rows else 0)
+    for r, row in enumerate(rows):
+        for c, code in enumerate(row):
+            game_object = CODE_GAME_OBJECT.get(code)
+            if game_object is None:
+                raise ValueError(f"Unknown cell code '{code}' at ({r}, {c})")
+            if game_object == GameObject.AGENT:
+                grid.set_agent(r, c)
+            elif game_object == GameObject.GOAL:
+                grid.set_goal(r, c)
+            elif game_object != GameObject.EMPTY:
+                grid.set_cell_type(r, c, game_object)
+    return grid
+
+
+def read_map_rows(path: str) -> list[list[str] | str]:
+    """
+    Read every encoded grid in a map file.
+
+    Accepts a Report file (list of runs with a 'grid' key), a single run or {'grid': ...} object, a bare grid
+    (list of rows) or a list of bare grids.
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return [data['grid']]
+    if not data:
+        return []
+    first = data[0]
+    if isinstance(first, dict):  # Report runs
+        return [run['grid'] for run in data]
+    if isinstance(first, str) or (first and isinstance(first[0], str)):  # Single grid
+        return [data]
+    return data
+
+
+def iter_map_files(paths: list[str]) -> Iterator[str]:
+    """
+    Expand map paths, yielding files as given and directory contents in sorted order.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(MAP_EXTENSIONS):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+@lru_cache(maxsize=4)
+def _cached_map_rows(path: str) -> list:
+    """
+    Read a JSON map file once per process.
+    """
+    return read_map_rows(path)
+
+
+@lru_cache(maxsize=4)
+def _cached_scenarios(path: str) -> list:
+    """
+    Read a scenario file once per process.
+    """
+    return read_scenarios(path)
+
+
+@lru_cache(maxsize=4)
+def _cached_ascii_cells(path: str) -> np.ndarray:
+    """
+    Import an ASCII map once per process. Its scenarios copy the cells.
+    """
+    return import_ascii_map(path).cells
+
+
+def count_grids(path: str) -> int:
+    """
+    Get the number of grids in a map file. Scenario files hold one grid per query, binary and ASCII map files a
+    single grid.
+    """
+    if path.endswith(JSON_EXTENSION):
+        return len(_cached_map_rows(path))  # Cached, so load_grid does not parse the file again
+    if path.endswith(SCENARIO_EXTENSION):
+        return len(_cached_scenarios(path))
+    return 1
+
+
+def load_grid(path: str, index: int = 0) -> Grid:
+    """
+    Load one grid from a map file. Binary map files are memory-mapped rather than read. Scenario queries are their
+    ASCII map with the agent and goal placed.
+    """
+    if path.endswith(BINARY_EXTENSION):
+        return load_map(path)
+    if path.endswith(ASCII_EXTENSION):
+        return import_ascii_map(path)
+    if path.endswith(SCENARIO_EXTENSION):
+        map_path, start, goal = _cached_scenarios(path)[index]
+        cells = _cached_ascii_cells(map_path)
+        grid = Grid(*cells.shape, cells=cells.copy())
+        grid.set_agent(*start)
+        grid.set_goal(*goal)
+        return grid
+    return decode_grid(_cached_map_rows(path)[index])
+
+
+def iter_grids(path: str) -> Iterator[tuple[int, Grid]]:
+    """
+    Lazily load the grids in a map file.
+
+    :return: (index, Grid) pairs
+    """
+    for index in range(count_grids(path)):
+        yield index, load_grid(path, index)
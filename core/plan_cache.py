@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_CELLS = 1_000_000
+
+
+class PlanCache:
+    """
+    Least-recently-used cache of planned paths (or Pareto fronts of paths), bounded by entry count and by the total
+    number of path cells stored.
+    """
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_cells: int = DEFAULT_MAX_CELLS):
+        self.max_entries = max_entries
+        self.max_cells = max_cells
+        self.entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.cells = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get a cached value and mark it as recently used.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, cells: int) -> None:
+        """
+        Cache a value holding the given number of path cells, evicting the least recently used values to stay within
+        bounds.
+        """
+        if cells > self.max_cells:
+            return
+        if key in self.entries:
+            self.cells -= self.entries.pop(key)[1]
+        self.entries[key] = (value, cells)
+        self.cells += cells
+        while len(self.entries) > self.max_entries or self.cells > self.max_cells:
+            _, (_, evicted_cells) = self.entries.popitem(last=False)
+            self.cells -= evicted_cells
+
+    def clear(self) -> None:
+        """
+        Remove all cached paths.
+        """
+        self.entries.clear()
+        self.cells = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
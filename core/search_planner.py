@@ -1,5 +1,9 @@
+from core.cancellation import CancellationToken, SearchInterrupted
 from core.grid import Grid
+from core.plan_cache import PlanCache
+from enums.plan_status import PlanStatus
 from pathfinder.base_pathfinder import BasePathfinder
+from pathfinder.pareto_front import ParetoFront
 import time
 
 
@@ -7,24 +11,113 @@ class SearchPlanner:
     """
     Computes paths from start to goal using a configured pathfinder algorithm.
     """
-    def __init__(self, pathfinder: BasePathfinder):
+    def __init__(self, pathfinder: BasePathfinder, cache: PlanCache | None = None, front_step_limit: int | None = None):
+        """
+        :param pathfinder: Pathfinder used to plan
+        :param cache: Plan cache, shared across pathfinder changes
+        :param front_step_limit: Step limit that Pareto fronts are computed up to, so later plans with any step limit
+                                 at or below it are lookups. Defaults to the step limit of the plan that computes it.
+        """
         self.pathfinder = pathfinder
+        self.cache = cache if cache is not None else PlanCache()
+        self.front_step_limit = front_step_limit
         self.last_compute_time = None
+        self.last_cache_hit = False
+        self.last_front: ParetoFront | None = None
+        self.last_status = PlanStatus.COMPLETE
 
-    def plan(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+    def plan(
+            self,
+            state_space: Grid,
+            start: tuple[int, int],
+            goal: tuple[int, int],
+            cancel_token: CancellationToken | None = None,
+            timeout: float | None = None
+    ) -> list[tuple[int, int]]:
         """
         Plan a path from start to goal using the instance's pathfinder.
 
         :param state_space: The state space (Grid)
         :param start: (row, col) start position
         :param goal: (row, col) goal position
-        :return: List of (row, col) steps from start to goal, or [] if no path is found
+        :param cancel_token: Token another thread can cancel to stop the search early
+        :param timeout: Seconds the search may take before it is stopped
+        :return: List of (row, col) steps from start to goal, or [] if no path is found. If the search was stopped,
+                 last_status says why and the path is the best found so far, usually [].
         """
         start_time = time.perf_counter()
-        path = self.pathfinder.search(state_space, start, goal)
+        self.last_cache_hit = False
+        self.last_status = PlanStatus.COMPLETE
+        self.pathfinder.set_interrupt(cancel_token, start_time + timeout if timeout is not None else None)
+        try:
+            self.pathfinder.check_interrupt()  # The token may already be cancelled
+            if self.pathfinder.unreachable(state_space, start, goal):
+                path = []
+                self.pathfinder.final_path = path
+            elif self.pathfinder.supports_front:
+                path = self._plan_from_front(state_space, start, goal)
+            else:
+                path = self._plan_path(state_space, start, goal)
+        except SearchInterrupted as interrupted:  # Stopped results are never cached
+            path = interrupted.path
+            self.pathfinder.final_path = path
+            self.last_status = interrupted.status
+        finally:
+            self.pathfinder.set_interrupt()
         end_time = time.perf_counter()
         self.last_compute_time = end_time - start_time
         return path
 
+    @staticmethod
+    def _cache_key(state_space: Grid, start: tuple[int, int], goal: tuple[int, int], pathfinder_key: tuple) -> tuple:
+        """
+        Cache key for a plan: grid contents, endpoints, algorithm and parameters.
+        """
+        return state_space.rows, state_space.cols, state_space.content_hash, start, goal, pathfinder_key
+
+    def _plan_path(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Plan a single path, reusing a cached plan when possible.
+        """
+        pathfinder_key = self.pathfinder.cache_key()
+        if pathfinder_key is None:
+            return self.pathfinder.search(state_space, start, goal)
+        key = self._cache_key(state_space, start, goal, pathfinder_key)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.last_cache_hit = True
+            path = list(cached)
+            self.pathfinder.final_path = path
+            return path
+        path = self.pathfinder.search(state_space, start, goal)
+        self.cache.put(key, tuple(path), len(path))
+        return path
+
+    def _plan_from_front(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Answer the plan from a Pareto front of score against steps, computing the front only if no cached front
+        covers the pathfinder's step limit. If that is interrupted, the best path of the cached front is kept.
+        """
+        step_limit = self.pathfinder.step_limit
+        front_key = self.pathfinder.front_key()
+        key = self._cache_key(state_space, start, goal, front_key) if front_key is not None else None
+        front = self.cache.get(key) if key is not None else None
+        if front is not None and front.covers(step_limit):
+            self.last_cache_hit = True
+        else:
+            max_step_limit = max(step_limit, self.front_step_limit or 0)
+            try:
+                front = self.pathfinder.search_front(state_space, start, goal, max_step_limit)
+            except SearchInterrupted as interrupted:
+                if front is not None:  # A front for a lower step limit still has valid paths
+                    interrupted.path = front.best(front.max_step_limit)
+                raise
+            if key is not None:
+                self.cache.put(key, front, front.size)
+        self.last_front = front
+        path = front.best(step_limit)
+        self.pathfinder.final_path = path
+        return path
+
     def set_pathfinder(self, pathfinder: BasePathfinder) -> None:
         self.pathfinder = pathfinder
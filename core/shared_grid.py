@@ -0,0 +1,104 @@
+import numpy as np
+from multiprocessing import shared_memory
+from core.grid import Grid
+
+
+class SharedGridHandle:
+    """
+    Lightweight, picklable reference to grid cells held in shared memory or a memory-mapped file.
+
+    Workers call attach() to get a Grid backed by the same cells without copying them. Pickling a shared Grid sends
+    only its handle, so grids can be passed to process pools directly. A grid only sees its own edits: call
+    Grid.invalidate() after another process writes the cells.
+    """
+    def __init__(
+            self,
+            rows: int,
+            cols: int,
+            shm_name: str | None = None,
+            path: str | None = None,
+            offset: int = 0,
+            mode: str = 'r+'
+    ):
+        self.rows = rows
+        self.cols = cols
+        self.shm_name = shm_name
+        self.path = path
+        self.offset = offset
+        self.mode = mode
+
+    def attach(self, agent_x_y: tuple[int, int] | None = None, goal_x_y: tuple[int, int] | None = None) -> Grid:
+        """
+        Get a Grid backed by the shared cells.
+
+        :param agent_x_y: Agent position to restore on the attached grid
+        :param goal_x_y: Goal position to restore on the attached grid
+        """
+        if self.shm_name is not None:
+            shm = _open_shared_memory(self.shm_name)
+            cells = np.ndarray((self.rows, self.cols), dtype=np.uint8, buffer=shm.buf)
+        else:
+            shm = None
+            cells = np.memmap(
+                self.path, dtype=np.uint8, mode=self.mode, offset=self.offset, shape=(self.rows, self.cols)
+            )
+        grid = Grid(self.rows, self.cols, cells=cells)
+        grid.agent_x_y = agent_x_y
+        grid.goal_x_y = goal_x_y
+        grid.handle = self
+        grid._shm = shm  # Keep the mapping open for the grid's lifetime
+        return grid
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing shared memory block without letting this process's resource tracker unlink it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+def share_grid(grid: Grid) -> SharedGridHandle:
+    """
+    Move a grid's cells into shared memory. The grid keeps working in place, backed by the shared block.
+
+    The caller owns the block and must call release_grid() once no process needs it.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(grid.cells.nbytes, 1))
+    cells = np.ndarray(grid.cells.shape, dtype=np.uint8, buffer=shm.buf)
+    cells[:] = grid.cells
+    grid.cells = cells
+    grid.handle = SharedGridHandle(grid.rows, grid.cols, shm_name=shm.name)
+    grid._shm = shm
+    grid._owns_shm = True
+    return grid.handle
+
+
+def memmap_grid(grid: Grid, path: str) -> SharedGridHandle:
+    """
+    Move a grid's cells into a memory-mapped file that any process can attach to.
+    """
+    cells = np.memmap(path, dtype=np.uint8, mode='w+', shape=grid.cells.shape)
+    cells[:] = grid.cells
+    cells.flush()
+    grid.cells = cells
+    grid.handle = SharedGridHandle(grid.rows, grid.cols, path=path)
+    return grid.handle
+
+
+def release_grid(grid: Grid) -> None:
+    """
+    Copy a shared grid's cells back into private memory and detach it. The shared memory block is freed if this
+    grid created it.
+    """
+    shm = grid._shm
+    grid.cells = np.array(grid.cells)
+    grid.handle = None
+    grid._shm = None
+    if shm is not None:
+        shm.close()
+        if grid._owns_shm:
+            shm.unlink()
+    grid._owns_shm = False
@@ -1,10 +1,5 @@
 from enum import Enum
-from pathfinder.reward_astar_pathfinder import RewardAStarPathfinder
-from pathfinder.reward_greedy_best_first_pathfinder import RewardGreedyBestFirstPathfinder
-from pathfinder.ucs_pathfinder import UCSPathfinder
-from pathfinder.bfs_pathfinder import BFSPathfinder
-from pathfinder.reward_randomized_hill_climbing_pathfinder import RewardRandomizedHillClimbingPathfinder
-from pathfinder.reward_simulated_annealing_pathfinder import RewardSimulatedAnnealingPathfinder
+from pathfinder import registry
 
 
 class Algorithm(Enum):
@@ -17,6 +12,15 @@ class Algorithm(Enum):
     BFS = "Breadth-First Search"
     RANDOMIZED_HILL_CLIMBING = "Randomized Hill Climbing"
     SIMULATED_ANNEALING = "Simulated Annealing"
+    JPS = "Jump Point Search"
+    HPA_STAR = "Hierarchical A* Search"
+    ANYTIME_ASTAR = "Anytime A* Search"
+    BEAM_SEARCH = "Beam Search"
+    SMA_STAR = "Memory-Bounded A* Search"
+    RESTART_HILL_CLIMBING = "Restart Hill Climbing"
+    PARALLEL_TEMPERING = "Parallel Tempering Annealing"
+    GENETIC = "Genetic Algorithm"
+    MCTS = "Monte Carlo Tree Search"
 
     def __init__(self, pretty_name: str):
         self._pretty_name = pretty_name
@@ -30,16 +34,9 @@ class Algorithm(Enum):
 
     def get_pathfinder(self):
         """
-        Get pathfinder from enum.
+        Get pathfinder from enum. The pathfinder module is imported on first use.
         """
-        return {
-            Algorithm.ASTAR: RewardAStarPathfinder,
-            Algorithm.GREEDY_SEARCH: RewardGreedyBestFirstPathfinder,
-            Algorithm.UCS: UCSPathfinder,
-            Algorithm.BFS: BFSPathfinder,
-            Algorithm.RANDOMIZED_HILL_CLIMBING: RewardRandomizedHillClimbingPathfinder,
-            Algorithm.SIMULATED_ANNEALING: RewardSimulatedAnnealingPathfinder
-        }[self]
+        return registry.get_pathfinder(self.name)
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,16 @@
+from enum import Enum, auto
+
+
+class PlanStatus(Enum):
+    """
+    Outcome of a plan.
+    """
+    COMPLETE = auto()  # The search finished; an empty path means no path exists
+    CANCELLED = auto()
+    DEADLINE_EXCEEDED = auto()
+
+    def __str__(self):
+        """
+        Get enum name.
+        """
+        return self.name
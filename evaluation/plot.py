@@ -215,3 +215,30 @@ def plot_avg_compute_time(avg_runs: list[dict], save_to_file: bool = False) -> N
         path = os.path.join(REPORTS_DIR, "avg_compute_time.png")
         plt.savefig(path)
     plt.show()
+
+
+def plot_beam_tradeoff(width_runs: list[dict], save_to_file: bool = False) -> None:
+    """
+    Visualize score and compute time against beam width (see evaluation.sweep.sweep_beam_widths).
+    """
+    beam_widths = [run['beam_width'] for run in width_runs]
+    scores = [run['score'] for run in width_runs]
+    compute_time = [run['compute_time'] * 1000 for run in width_runs]  # Convert to ms
+
+    fig, score_axis = plt.subplots(figsize=(10, 6))
+    score_axis.plot(beam_widths, scores, marker='o', color="tab:green")
+    score_axis.set_xscale('log', base=2)
+    score_axis.set_xlabel('Beam Width', labelpad=10)
+    score_axis.set_ylabel('Score', labelpad=10, color="tab:green")
+
+    time_axis = score_axis.twinx()
+    time_axis.plot(beam_widths, compute_time, marker='s', color="tab:orange")
+    time_axis.set_ylabel('Compute Time (ms)', labelpad=10, color="tab:orange")
+
+    plt.title('Beam Search Score and Compute Time by Beam Width', pad=15)
+    fig.tight_layout()
+
+    if save_to_file:
+        path = os.path.join(REPORTS_DIR, "beam_tradeoff.png")
+        plt.savefig(path)
+    plt.show()
@@ -14,6 +14,22 @@ GAME_OBJECT_CODE = {
 }
 
 
+def score_path(grid: Grid, path: list[tuple[int, int]], coin_reward: int, trash_reward: int) -> tuple[int, dict]:
+    """
+    Score a path by collecting each coin and trash cell once.
+    """
+    score = 0
+    collected = {GameObject.COIN.name: 0, GameObject.TRASH.name: 0}
+    seen = set()
+    for pos in path:
+        cell = grid.get_cell_type(*pos)
+        if cell in (GameObject.COIN, GameObject.TRASH) and pos not in seen:
+            seen.add(pos)
+            collected[cell.name] += 1
+            score += coin_reward if cell == GameObject.COIN else trash_reward
+    return score, collected
+
+
 class Report:
     """
     Report class for performance metrics.
@@ -60,8 +76,8 @@ class Report:
         Serialize grid for writing to json.
         """
         return [
-            [GAME_OBJECT_CODE.get(cell, "?") for cell in row]
-            for row in grid.grid
+            [GAME_OBJECT_CODE.get(grid.get_cell_type(r, c), "?") for c in range(grid.cols)]
+            for r in range(grid.rows)
         ]
 
     def save_json(self, filename: str = "report.json") -> None:
@@ -0,0 +1,79 @@
+from core.grid import Grid
+from core.search_planner import SearchPlanner
+from enums.algorithm import Algorithm
+from evaluation.report import score_path
+
+
+def sweep_step_limits(
+        algorithm: Algorithm,
+        grid: Grid,
+        step_limits: list[int],
+        coin_reward: int,
+        trash_reward: int,
+        start: tuple[int, int] | None = None,
+        goal: tuple[int, int] | None = None
+) -> list[dict]:
+    """
+    Measure how an algorithm's result changes with the step limit.
+
+    Reward-aware pathfinders that support Pareto fronts search once, up to the largest step limit, and answer every
+    other step limit with a lookup.
+
+    :return: One dict per step limit with success, steps taken, score, states explored and compute time
+    """
+    start = start or grid.agent_x_y
+    goal = goal or grid.goal_x_y
+    pathfinder = algorithm.get_pathfinder()
+    planner = SearchPlanner(pathfinder(max(step_limits), coin_reward, trash_reward), front_step_limit=max(step_limits))
+    runs = []
+    for step_limit in step_limits:
+        planner.set_pathfinder(pathfinder(step_limit, coin_reward, trash_reward))
+        path = planner.plan(grid, start, goal)
+        score, collected = score_path(grid, path, coin_reward, trash_reward)
+        runs.append({
+            'algorithm': algorithm.pretty,
+            'step_limit': step_limit,
+            'success': bool(path),
+            'steps_taken': max(len(path) - 1, 0),
+            'score': score,
+            'collected': collected,
+            'states_explored': planner.pathfinder.states_explored,
+            'compute_time': planner.last_compute_time
+        })
+    return runs
+
+
+def sweep_beam_widths(
+        grid: Grid,
+        beam_widths: list[int],
+        step_limit: int,
+        coin_reward: int,
+        trash_reward: int,
+        start: tuple[int, int] | None = None,
+        goal: tuple[int, int] | None = None
+) -> list[dict]:
+    """
+    Measure the score-versus-cost tradeoff of beam search as the beam width grows.
+
+    :return: One dict per beam width with success, steps taken, score, states explored and compute time
+    """
+    start = start or grid.agent_x_y
+    goal = goal or grid.goal_x_y
+    pathfinder = Algorithm.BEAM_SEARCH.get_pathfinder()
+    runs = []
+    for beam_width in beam_widths:
+        planner = SearchPlanner(pathfinder(step_limit, coin_reward, trash_reward, beam_width=beam_width))
+        path = planner.plan(grid, start, goal)
+        score, collected = score_path(grid, path, coin_reward, trash_reward)
+        runs.append({
+            'algorithm': Algorithm.BEAM_SEARCH.pretty,
+            'beam_width': beam_width,
+            'step_limit': step_limit,
+            'success': bool(path),
+            'steps_taken': max(len(path) - 1, 0),
+            'score': score,
+            'collected': collected,
+            'states_explored': planner.pathfinder.states_explored,
+            'compute_time': planner.last_compute_time
+        })
+    return runs
@@ -0,0 +1,196 @@
+import time
+from pathfinder.reward_astar_pathfinder import RewardAStarPathfinder
+from core.cancellation import SearchInterrupted
+from pathfinder.frontier import Frontier
+from pathfinder.reward_bound import RewardBound
+from core.grid import Grid, NO_ITEM
+from core.grid_analysis import GridAnalysis
+
+WEIGHTS = (3.0, 2.0, 1.5, 1.25, 1.0)  # Inflation weights of successive runs, ending with an exact run
+CHECK_INTERVAL = 256  # Expansions between time budget checks
+
+
+class AnytimeRewardAStarPathfinder(RewardAStarPathfinder):
+    """
+    Anytime reward-aware A* (ARA*-style) that reruns with shrinking weights until its time budget runs out.
+    """
+    cacheable = False  # Results depend on the time budget
+    supports_front = False
+
+    def __init__(
+            self,
+            step_limit,
+            coin_reward,
+            trash_reward,
+            heuristic=None,
+            reward_weight=1.0,
+            time_budget: float | None = 0.05,
+            weights: tuple[float, ...] = WEIGHTS
+    ):
+        """
+        :param time_budget: Seconds each call to search or improve may take, or None to run to completion
+        :param weights: Weights of successive runs, decreasing to 1
+        """
+        super().__init__(step_limit, coin_reward, trash_reward, heuristic, reward_weight)
+        self.time_budget = time_budget
+        self.weights = weights
+        self.best_score = None
+        self.complete = False  # Best path is proven optimal, or no path fits the step limit
+        self._run = None  # Suspended search, resumed by improve
+        self._bound = None  # Upper bound from the last completed run
+        self._weight = None
+        self._frontier = None
+        self._pool = None
+        self._reward_bound = None
+        self._positive_reward = 0
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute the best path from start to goal that the time budget allows.
+        """
+        self.best_score = None
+        self.final_path = []
+        self.complete = False
+        self._bound = None
+        self._run = self._anytime_search(state_space, start, goal)
+        return self.improve(self.time_budget)
+
+    def improve(self, time_budget: float | None = None) -> list[tuple[int, int]]:
+        """
+        Continue the last search for up to time_budget seconds, or to completion if None.
+
+        :return: Best path found so far
+        """
+        if self._run is None or self.complete:
+            return self.final_path
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        try:
+            for _ in self._run:
+                self.check_interrupt()
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+        except SearchInterrupted as interrupted:
+            interrupted.path = self.final_path  # The best path so far is still valid
+            raise
+        return self.final_path
+
+    @property
+    def score_bound(self) -> float | None:
+        """
+        Upper bound on the best score any path within the step limit can reach, or None if no path can.
+        """
+        if self.complete:
+            return self.best_score
+        bounds = [self._bound] if self._bound is not None else []
+        if self._frontier is not None:  # Interrupted run: bound by its open nodes and what it pruned
+            pool, reward_bound = self._pool, self._reward_bound
+            open_bound = max(
+                (
+                    pool.scores[node] + reward_bound.remaining(pool.pos_ids[node], pool.steps[node],
+                                                               pool.masks[pool.mask_ids[node]])
+                    for node in self._frontier
+                ),
+                default=None
+            )
+            run_bound = None if self.best_score is None else self._pruned_bound(self.best_score, self._weight)
+            candidates = [bound for bound in (open_bound, run_bound) if bound is not None]
+            if candidates:
+                bounds.append(max(candidates))
+        return min(bounds) if bounds else None
+
+    def _pruned_bound(self, best_score: float, weight: float) -> float:
+        """
+        Upper bound on the optimal score once a run with the given weight has pruned against best_score.
+        """
+        return best_score + (1 - 1 / weight) * self._positive_reward
+
+    def _anytime_search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]):
+        """
+        Generator running the weighted searches, suspending every CHECK_INTERVAL expansions. The runs share one node
+        pool and visited table, and each run starts from the nodes the previous one set aside (see _weighted_search).
+        """
+        self.analysis = GridAnalysis.for_grid(state_space)
+        goal_distance = self.analysis.distance_field(goal)
+        item_rewards = self.item_rewards(self.analysis)
+        self._reward_bound = RewardBound(self.analysis, item_rewards, start, goal, self.step_limit)
+        self._positive_reward = self._reward_bound.total
+        if goal_distance[start] > self.step_limit:  # Goal cannot be reached in time
+            self.complete = True
+            return
+        pool = self._pool = self.new_node_pool(state_space.cols)
+        visited = {}
+        inconsistent = [pool.add(start, 0, 0, pool.intern_mask(0))]  # Nodes the next run starts from
+        for weight in self.weights:
+            yield from self._weighted_search(state_space, goal, weight, goal_distance, item_rewards, visited,
+                                             inconsistent)
+            self._frontier = None
+            if self.best_score is not None:
+                bound = self._pruned_bound(self.best_score, weight)
+                self._bound = bound if self._bound is None else min(self._bound, bound)
+            if weight <= 1 or not inconsistent:  # Exact, or no node was set aside
+                self.complete = True
+                return
+
+    def _weighted_search(self, state_space, goal, weight, goal_distance, item_rewards, visited, inconsistent):
+        """
+        One reward-aware A* run with the given weight, resuming from the nodes the last run set aside in inconsistent.
+        """
+        item_index = state_space.item_index
+        heuristic = self.analysis.heuristic_rows(self.heuristic, goal)
+        step_limit = self.step_limit
+        reward_weight = self.reward_weight
+        cells = state_space.rows * state_space.cols
+        pool = self._pool
+        reward_bound = self._reward_bound
+        frontier = Frontier()
+        self._weight, self._frontier = weight, frontier
+        for node in inconsistent:
+            row, col = pool.position(node)
+            frontier.push(pool.steps[node] + weight * heuristic[row][col] - reward_weight * pool.scores[node], node)
+        inconsistent.clear()
+        slack = (1 - 1 / weight) * self._positive_reward  # Improvement this run does not look for
+        expansions = 0
+        while frontier:
+            expansions += 1
+            if expansions % CHECK_INTERVAL == 0:
+                yield
+            self.states_explored += 1
+            node = frontier.pop()
+            pos = pool.position(node)
+            score = pool.scores[node]
+            steps = pool.steps[node]
+            mask_id = pool.mask_ids[node]
+            collected_mask = pool.masks[mask_id]
+            if pos == goal:  # Goal test
+                if self.best_score is None or score > self.best_score:
+                    self.best_score = score
+                    self.final_path = pool.path(node)
+                pool.release(node)
+                continue
+            optimistic = score + reward_bound.remaining(pool.pos_ids[node], steps, collected_mask)
+            if self.best_score is not None and optimistic - slack <= self.best_score:
+                if optimistic <= self.best_score:
+                    pool.release(node)  # Cannot improve on the best path at all
+                else:
+                    inconsistent.append(node)  # Cannot improve by more than the slack, left for a smaller weight
+                continue
+            state_key = mask_id * cells + pool.pos_ids[node]
+            if state_key in visited:  # Skip state if no improvement
+                prev_score, prev_steps = visited[state_key]
+                if score <= prev_score and steps >= prev_steps:
+                    pool.release(node)
+                    continue
+            visited[state_key] = (score, steps)
+            for neighbor in state_space.get_adjacent(*pos):
+                if steps + 1 + int(goal_distance[neighbor]) > step_limit:  # Skip if goal is out of reach
+                    continue
+                item = int(item_index[neighbor])
+                reward = 0
+                new_mask_id = mask_id
+                if item != NO_ITEM and not (collected_mask >> item) & 1:
+                    reward = item_rewards[item]
+                    new_mask_id = pool.intern_mask(collected_mask | (1 << item))
+                new_score = score + reward
+                new_node = pool.add(neighbor, new_score, steps + 1, new_mask_id, node)
+                f = steps + 1 + weight * heuristic[neighbor[0]][neighbor[1]] - (reward_weight * new_score)
+                frontier.push(f, new_node)
@@ -1,17 +1,89 @@
 from abc import ABC, abstractmethod
+from core.cancellation import CancellationToken, SearchInterrupted
 from core.grid import Grid
+from core.heuristic import manhattan
+from enums.plan_status import PlanStatus
+import time
+
+INTERRUPT_CHECK_INTERVAL = 1024  # Expansions between cancellation and deadline checks
 
 
 class BasePathfinder(ABC):
     """
     Abstract base class for all pathfinding algorithms.
     """
+    cacheable = True  # Deterministic pathfinders can have their plans cached by SearchPlanner
+    supports_front = False  # Pathfinders that can answer every step limit from one search (see search_front)
+
     def __init__(self, step_limit: int, coin_reward: int, trash_reward: int):
         self.step_limit = step_limit
         self.coin_reward = coin_reward
         self.trash_reward = trash_reward
         self.states_explored = 0
         self.final_path: list[tuple[int, int]] = []
+        self.analysis = None  # Reward-independent GridAnalysis used by the last search, if any
+        self.cancel_token: CancellationToken | None = None
+        self.deadline: float | None = None  # time.perf_counter() value after which searches stop
+
+    def set_rewards(self, coin_reward: int, trash_reward: int) -> None:
+        """
+        Update reward values. Reward-independent preprocessing is kept.
+        """
+        self.coin_reward = coin_reward
+        self.trash_reward = trash_reward
+
+    def set_interrupt(self, cancel_token: CancellationToken | None = None, deadline: float | None = None) -> None:
+        """
+        Set the cancellation token and deadline that searches check, or clear them.
+        """
+        self.cancel_token = cancel_token
+        self.deadline = deadline
+
+    def check_interrupt(self) -> None:
+        """
+        Raise SearchInterrupted if the search was cancelled or its deadline has passed. Search loops call this every
+        INTERRUPT_CHECK_INTERVAL expansions.
+        """
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            raise SearchInterrupted(PlanStatus.CANCELLED)
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchInterrupted(PlanStatus.DEADLINE_EXCEEDED)
+
+    def unreachable(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> bool:
+        """
+        Determine in O(1) if the goal is walled off from start or further than the step limit allows.
+        """
+        return manhattan(start, goal) > self.step_limit or not state_space.connected(start, goal)
+
+    def parameters(self) -> tuple:
+        """
+        Get the parameters other than step limit that determine this pathfinder's result.
+        """
+        return self.coin_reward, self.trash_reward
+
+    def cache_key(self) -> tuple | None:
+        """
+        Get the algorithm and parameters that determine this pathfinder's result, or None if it is not cacheable.
+        """
+        if not self.cacheable:
+            return None
+        return (type(self), self.step_limit) + self.parameters()
+
+    def front_key(self) -> tuple | None:
+        """
+        Get the algorithm and parameters that determine this pathfinder's Pareto front, which covers every step limit.
+        """
+        if not (self.cacheable and self.supports_front):
+            return None
+        return (type(self),) + self.parameters()
+
+    def search_front(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int], max_step_limit: int):
+        """
+        Compute the best path from start to goal for every step limit up to max_step_limit in a single search.
+
+        :return: ParetoFront of goal-reaching paths
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support Pareto fronts")
 
     @abstractmethod
     def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
@@ -24,3 +96,10 @@ class BasePathfinder(ABC):
         :return: List of (row, col) steps from start to goal, or [] if no path
         """
         pass
+
+
+class RandomizedPathfinder(BasePathfinder):
+    """
+    Base class for randomized pathfinders. Every plan is a fresh draw, so none are cached.
+    """
+    cacheable = False
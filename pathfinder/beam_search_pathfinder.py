@@ -0,0 +1,109 @@
+import heapq
+from pathfinder.reward_astar_pathfinder import RewardAStarPathfinder
+from pathfinder.base_pathfinder import INTERRUPT_CHECK_INTERVAL
+from pathfinder.reward_bound import RewardBound
+from core.grid import Grid, NO_ITEM
+from core.grid_analysis import GridAnalysis
+
+BEAM_WIDTH = 64  # Default number of partial paths kept per depth
+
+
+class BeamSearchPathfinder(RewardAStarPathfinder):
+    """
+    Reward-aware beam search pathfinder, keeping the beam_width best partial paths at each depth.
+    """
+    supports_front = False  # The beam kept at each depth depends on the step limit
+
+    def __init__(
+            self,
+            step_limit,
+            coin_reward,
+            trash_reward,
+            heuristic=None,
+            reward_weight=1.0,
+            beam_width: int = BEAM_WIDTH
+    ):
+        """
+        :param beam_width: Partial paths kept per depth
+        """
+        super().__init__(step_limit, coin_reward, trash_reward, heuristic, reward_weight)
+        if beam_width < 1:
+            raise ValueError(f"Beam width must be at least 1, got {beam_width}")
+        self.beam_width = beam_width
+
+    def parameters(self) -> tuple:
+        """
+        Get the parameters other than step limit that determine this pathfinder's result.
+        """
+        return super().parameters() + (self.beam_width,)
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute a path from start to goal in the given state space.
+        """
+        self.final_path = []
+        self.analysis = GridAnalysis.for_grid(state_space)
+        goal_distance = self.analysis.distance_field(goal)
+        if goal_distance[start] > self.step_limit:  # Goal cannot be reached in time
+            return self.final_path
+        if start == goal:
+            self.final_path = [start]
+            return self.final_path
+        heuristic = self.analysis.heuristic_rows(self.heuristic, goal)
+        item_index = state_space.item_index
+        item_rewards = self.item_rewards(self.analysis)
+        pool = self.new_node_pool(state_space.cols)
+        bound = RewardBound(self.analysis, item_rewards, start, goal, self.step_limit)
+        cells = state_space.rows * state_space.cols
+        beam = [pool.add(start, 0, 0, pool.intern_mask(0))]
+        visited = {}
+        best_goal = None
+        for steps in range(self.step_limit):
+            candidates = {}  # State key -> (f, score, pos, mask id, parent) of the best successor reaching it
+            for node in beam:
+                self.states_explored += 1
+                if not self.states_explored % INTERRUPT_CHECK_INTERVAL:
+                    self.check_interrupt()
+                score = pool.scores[node]
+                collected_mask = pool.masks[pool.mask_ids[node]]
+                for neighbor in state_space.get_adjacent(*pool.position(node)):
+                    if steps + 1 + int(goal_distance[neighbor]) > self.step_limit:  # Skip if goal is out of reach
+                        continue
+                    item = int(item_index[neighbor])
+                    new_score = score
+                    new_mask_id = pool.mask_ids[node]
+                    if item != NO_ITEM and not (collected_mask >> item) & 1:  # Add reward if not yet collected
+                        new_score += item_rewards[item]
+                        new_mask_id = pool.intern_mask(collected_mask | (1 << item))
+                    state_key = new_mask_id * cells + neighbor[0] * state_space.cols + neighbor[1]
+                    best = candidates.get(state_key)
+                    if best is not None and best[1] >= new_score:  # Merge successors reaching the same state
+                        continue
+                    f = steps + 1 + heuristic[neighbor[0]][neighbor[1]] - (self.reward_weight * new_score)
+                    candidates[state_key] = (f, new_score, neighbor, new_mask_id, node)
+            fresh, revisits = [], []
+            for state_key, (f, score, pos, mask_id, parent) in candidates.items():
+                if pos == goal:  # Goal test; goal nodes are not expanded
+                    if best_goal is None or score > pool.scores[best_goal]:
+                        best_goal = pool.add(pos, score, steps + 1, mask_id, parent)
+                        bound.record(steps + 1, score)
+                    continue
+                if bound.prunes(pos[0] * state_space.cols + pos[1], steps + 1, score, pool.masks[mask_id]):
+                    continue
+                previous = visited.get(state_key)
+                if previous is not None and previous >= score:  # Reached earlier with at least this score
+                    revisits.append((f, state_key, score, pos, mask_id, parent))
+                else:
+                    fresh.append((f, state_key, score, pos, mask_id, parent))
+            # Revisits only fill slots left over, so narrow beams cannot run dry before reaching the goal
+            chosen = heapq.nsmallest(self.beam_width, fresh, key=lambda c: c[0])
+            chosen += heapq.nsmallest(self.beam_width - len(chosen), revisits, key=lambda c: c[0])
+            beam = []
+            for f, state_key, score, pos, mask_id, parent in chosen:
+                visited[state_key] = max(score, visited.get(state_key, score))
+                beam.append(pool.add(pos, score, steps + 1, mask_id, parent))
+            if not beam:
+                break
+        if best_goal is not None:
+            self.final_path = pool.path(best_goal)
+        return self.final_path
@@ -1,9 +1,10 @@
 from collections import deque
-from pathfinder.base_pathfinder import BasePathfinder
+from pathfinder.base_pathfinder import INTERRUPT_CHECK_INTERVAL
+from pathfinder.reward_unaware_pathfinder import RewardUnawarePathfinder
 from core.grid import Grid
 
 
-class BFSPathfinder(BasePathfinder):
+class BFSPathfinder(RewardUnawarePathfinder):
     """
     Breadth-First Search pathfinder
     """
@@ -20,6 +21,8 @@ class BFSPathfinder(BasePathfinder):
         while frontier:
             current, path = frontier.popleft()  # Pop node from frontier
             self.states_explored += 1
+            if not self.states_explored % INTERRUPT_CHECK_INTERVAL:
+                self.check_interrupt()
             if len(path) - 1 > self.step_limit or current in visited:  # Skip invalid or visited nodes
                 continue
             visited.add(current)  # Add node to visited set
@@ -0,0 +1,64 @@
+import numpy as np
+from pathfinder.reward_unaware_pathfinder import RewardUnawarePathfinder
+from core.bitboard import DIRECTIONS, neighbor_candidates
+from core.grid import Grid
+from core.grid_analysis import GridAnalysis
+
+
+class BitboardBFSPathfinder(RewardUnawarePathfinder):
+    """
+    Breadth-First Search pathfinder that expands a whole level at a time with NumPy, returning BFSPathfinder's path.
+    """
+    def __init__(self, step_limit: int, coin_reward: int, trash_reward: int):
+        super().__init__(step_limit, coin_reward, trash_reward)
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute a path from start to goal in the given state space.
+        """
+        self.analysis = GridAnalysis.for_grid(state_space)
+        rows, cols = state_space.rows, state_space.cols
+        walkable = self.analysis.walkable.ravel()
+        source = start[0] * cols + start[1]
+        target = goal[0] * cols + goal[1]
+        parent_direction = np.full(rows * cols, -1, dtype=np.int8)
+        visited = np.zeros(rows * cols, dtype=bool)
+        visited[source] = True
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+        while not visited[target] and frontier.size and level < self.step_limit:
+            self.states_explored += frontier.size
+            self.check_interrupt()  # Levels are large, so check every level
+            neighbors, positions = neighbor_candidates(frontier, rows, cols)
+            keep = walkable[neighbors] & ~visited[neighbors]
+            neighbors, positions = neighbors[keep], positions[keep]
+            _, first = np.unique(neighbors, return_index=True)  # First push of each cell, as in a FIFO queue
+            first.sort()
+            frontier = neighbors[first]
+            parent_direction[frontier] = positions[first] % 4
+            visited[frontier] = True
+            level += 1
+        if not visited[target]:
+            self.final_path = []
+            return []
+        self.final_path = self._reconstruct(parent_direction, source, target, cols)
+        return self.final_path
+
+    @staticmethod
+    def _reconstruct(parent_direction: np.ndarray, source: int, target: int, cols: int) -> list[tuple[int, int]]:
+        """
+        Walk parent directions back from target to source.
+        """
+        offsets = [dr * cols + dc for dr, dc in DIRECTIONS]
+        path = [divmod(target, cols)]
+        cell = target
+        while cell != source:
+            cell -= offsets[parent_direction[cell]]
+            path.append(divmod(cell, cols))
+        return list(reversed(path))
+
+    def distance_field(self, state_space: Grid, source: tuple[int, int]) -> np.ndarray:
+        """
+        Get the step distance from source to every cell.
+        """
+        return GridAnalysis.for_grid(state_space).distance_field(source)
@@ -0,0 +1,98 @@
+import heapq
+from collections import deque
+from itertools import count
+from typing import Any
+
+MAX_BUCKETS = 4096  # Widest priority range kept in buckets before moving to the heap
+
+
+class Frontier:
+    """
+    Priority queue frontier that pops the lowest priority first and, among equal priorities, the earliest pushed.
+
+    While every priority is integral it is a bucket queue (Dial's algorithm): one FIFO bucket per priority and a
+    cursor at the lowest bucket that may be non-empty, so pushes are O(1) and store no priority tuple. Priorities may
+    go below the cursor, as reward-aware searches produce, and the cursor moves back. The first non-integral priority,
+    or the first push that would spread the buckets over more than MAX_BUCKETS priorities, as large reward values
+    produce, moves every item onto a binary heap, which keeps the same order.
+    """
+    def __init__(self):
+        self._buckets: list[deque] = []
+        self._base = 0  # Priority of the first bucket
+        self._cursor = 0  # Index of the lowest bucket that may be non-empty
+        self._size = 0
+        self._heap: list | None = None
+        self._counter = count()
+
+    def push(self, priority: float, item: Any) -> None:
+        """
+        Add an item with the given priority.
+        """
+        if self._heap is None:
+            key = int(priority)
+            if key == priority:
+                buckets = self._buckets
+                if not buckets:
+                    self._base = key
+                index = key - self._base
+                if index >= len(buckets) and self._cursor > len(buckets) // 2:  # Drop buckets already popped
+                    del buckets[:self._cursor]
+                    self._base += self._cursor
+                    index -= self._cursor
+                    self._cursor = 0
+                if max(index + 1, len(buckets) - min(index, 0)) <= MAX_BUCKETS:
+                    if index < 0:  # Grow downwards
+                        buckets[:0] = [deque() for _ in range(-index)]
+                        self._base = key
+                        self._cursor -= index
+                        index = 0
+                    elif index >= len(buckets):
+                        buckets.extend(deque() for _ in range(index + 1 - len(buckets)))
+                    buckets[index].append(item)
+                    if index < self._cursor:
+                        self._cursor = index
+                    self._size += 1
+                    return
+            self._to_heap()
+        heapq.heappush(self._heap, (priority, next(self._counter), item))
+
+    def pop(self) -> Any:
+        """
+        Remove and return the item with the lowest priority.
+        """
+        if self._heap is not None:
+            return heapq.heappop(self._heap)[2]
+        if not self._size:
+            raise IndexError("pop from an empty frontier")
+        buckets = self._buckets
+        while not buckets[self._cursor]:
+            self._cursor += 1
+        self._size -= 1
+        return buckets[self._cursor].popleft()
+
+    def _to_heap(self) -> None:
+        """
+        Move bucketed items onto a heap. Buckets are visited in priority and push order, so the list is already a heap.
+        """
+        counter = self._counter
+        self._heap = [
+            (self._base + index, next(counter), item)
+            for index in range(self._cursor, len(self._buckets))
+            for item in self._buckets[index]
+        ]
+        self._buckets = []
+        self._size = 0
+
+    def __iter__(self):
+        """
+        Iterate over the queued items in no particular order.
+        """
+        if self._heap is not None:
+            return (entry[2] for entry in self._heap)
+        return (item for bucket in self._buckets for item in bucket)
+
+    def __len__(self) -> int:
+        return len(self._heap) if self._heap is not None else self._size
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
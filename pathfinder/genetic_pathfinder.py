@@ -0,0 +1,138 @@
+import time
+import numpy as np
+from pathfinder.base_pathfinder import RandomizedPathfinder
+from pathfinder.reward_aware_pathfinder import RewardAwarePathfinder
+from pathfinder.waypoint_space import WaypointSpace
+from pathfinder import worker_pool
+from core.cancellation import SearchInterrupted
+from core.grid import Grid
+from core.grid_analysis import GridAnalysis
+
+TIME_BUDGET = 0.05  # Default seconds spent evolving
+POPULATION = 64
+ELITE_FRACTION = 0.1  # Share of each generation copied unchanged from the best of the last
+MUTANT_FRACTION = 0.1  # Share of each generation drawn at random
+CROSSOVER_BIAS = 0.7  # Probability a child takes each key from its elite parent
+INCLUDE_KEY = 0.5  # Items with a key below this are not visited
+
+
+class GeneticPathfinder(RandomizedPathfinder, RewardAwarePathfinder):
+    """
+    Reward-aware biased random-key genetic algorithm over item visit orders.
+    """
+    def __init__(
+            self,
+            step_limit,
+            coin_reward,
+            trash_reward,
+            time_budget: float | None = TIME_BUDGET,
+            generations: int | None = None,
+            population: int = POPULATION,
+            elite_fraction: float = ELITE_FRACTION,
+            mutant_fraction: float = MUTANT_FRACTION,
+            crossover_bias: float = CROSSOVER_BIAS,
+            seed: int | None = None
+    ):
+        """
+        :param time_budget: Seconds spent evolving, or None to run exactly generations generations
+        :param generations: Cap on generations, or None for no cap
+        :param population: Individuals per generation
+        :param elite_fraction: Share of each generation kept from the best of the last
+        :param mutant_fraction: Share of each generation drawn at random
+        :param crossover_bias: Probability a child inherits each key from its elite parent
+        :param seed: Seed for reproducible runs
+        """
+        super().__init__(step_limit, coin_reward, trash_reward)
+        if time_budget is None and generations is None:
+            raise ValueError("Set a time budget, a number of generations, or both")
+        self.time_budget = time_budget
+        self.generations = generations
+        self.population = population
+        self.elites = max(int(population * elite_fraction), 1)
+        self.mutants = int(population * mutant_fraction)
+        if self.elites + self.mutants >= population:
+            raise ValueError(f"Elites and mutants must leave room for children in a population of {population}")
+        self.crossover_bias = crossover_bias
+        self.seed = seed
+        self.generations_run = 0
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute the best path from start to goal that the evolution finds.
+        """
+        self.final_path = []
+        self.generations_run = 0
+        time_budget = worker_pool.remaining_budget(self, self.time_budget)
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None  # Covers setup too
+        self.analysis = GridAnalysis.for_grid(state_space)
+        if self.analysis.distance(start, goal) > self.step_limit:  # Goal cannot be reached in time
+            return self.final_path
+        space = WaypointSpace(state_space, self.analysis, start, goal, self.item_rewards(self.analysis),
+                              self.step_limit, deadline=deadline, check_interrupt=self.check_interrupt)
+        if not space.size:  # Nothing to collect, so the shortest path is best
+            self.final_path = space.expand([])
+            return self.final_path
+        rng = np.random.default_rng(self.seed)
+        keys = rng.random((self.population, space.size))
+        keys[0] *= INCLUDE_KEY  # One individual takes the shortest path
+        best_score, best_steps, best_path = None, None, []
+        try:
+            while self.generations is None or self.generations_run < self.generations:
+                if self.generations_run and deadline is not None and time.perf_counter() >= deadline:
+                    break
+                self.check_interrupt()
+                self.generations_run += 1
+                self.states_explored += self.population
+                packed = self._decode(keys, space)
+                steps, scores = space.evaluate(packed)
+                ranking = np.lexsort((steps, -scores))  # Best first: highest score, then fewest steps
+                top = ranking[0]
+                if best_score is None or (scores[top], -steps[top]) > (best_score, -best_steps):
+                    best_score, best_steps = float(scores[top]), int(steps[top])
+                    best_path = [int(node) for node in packed[top, 1:] if node != space.goal]
+                keys = self._breed(keys[ranking], rng)
+        except SearchInterrupted as interrupted:
+            interrupted.path = space.expand(best_path)  # The best path so far is still valid
+            raise
+        self.final_path = space.expand(best_path)
+        return self.final_path
+
+    def _decode(self, keys: np.ndarray, space: WaypointSpace) -> np.ndarray:
+        """
+        Decode every individual into its packed path (see WaypointSpace.pack), skipping items that leave the goal out
+        of reach.
+        """
+        order = np.argsort(keys, axis=1)
+        include = np.take_along_axis(keys, order, axis=1) >= INCLUDE_KEY
+        distances = space.distances
+        current = np.full(len(keys), space.start)
+        steps = np.zeros(len(keys), dtype=np.int64)
+        taken = np.zeros(order.shape, dtype=bool)
+        for k in range(space.size):
+            item = order[:, k]
+            to_item = distances[current, item]
+            take = include[:, k] & (steps + to_item + distances[item, space.goal] <= self.step_limit)
+            steps = np.where(take, steps + to_item, steps)
+            current = np.where(take, item, current)
+            taken[:, k] = take
+        compact = np.argsort(~taken, axis=1, kind='stable')  # Visited items first, in visit order
+        waypoints = np.where(np.take_along_axis(taken, compact, axis=1),
+                             np.take_along_axis(order, compact, axis=1), space.goal)
+        packed = np.full((len(keys), space.size + 2), space.goal, dtype=np.int64)
+        packed[:, 0] = space.start
+        packed[:, 1:-1] = waypoints
+        return packed
+
+    def _breed(self, ranked: np.ndarray, rng) -> np.ndarray:
+        """
+        Build the next generation from the current one, sorted best first.
+        """
+        children = self.population - self.elites - self.mutants
+        elite_parents = ranked[rng.integers(self.elites, size=children)]
+        other_parents = ranked[rng.integers(self.elites, self.population, size=children)]
+        inherit = rng.random(elite_parents.shape) < self.crossover_bias
+        return np.concatenate((
+            ranked[:self.elites],
+            rng.random((self.mutants, ranked.shape[1])),
+            np.where(inherit, elite_parents, other_parents)
+        ))
@@ -0,0 +1,121 @@
+import heapq
+from pathfinder.base_pathfinder import INTERRUPT_CHECK_INTERVAL
+from pathfinder.reward_unaware_pathfinder import RewardUnawarePathfinder
+from pathfinder.bitboard_bfs_pathfinder import BitboardBFSPathfinder
+from core.grid import Grid
+from core.heuristic import manhattan
+
+CLUSTER_SIZE = 32  # Default cluster side length in cells
+START, GOAL = -1, -2  # Abstract node ids of the query endpoints, which are not entrances
+
+
+class HPAPathfinder(RewardUnawarePathfinder):
+    """
+    Hierarchical pathfinder (HPA*) over the grid's cluster graph, falling back to breadth-first search.
+    """
+    def __init__(self, step_limit: int, coin_reward: int, trash_reward: int, cluster_size: int = CLUSTER_SIZE):
+        super().__init__(step_limit, coin_reward, trash_reward)
+        self.cluster_size = cluster_size
+
+    def parameters(self) -> tuple:
+        """
+        Get the parameters other than step limit that determine this pathfinder's result.
+        """
+        return super().parameters() + (self.cluster_size,)
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute a path from start to goal in the given state space.
+        """
+        path = self._hierarchical_search(state_space, start, goal)
+        if not path and not self.unreachable(state_space, start, goal):  # Only an exact search can rule out a path
+            exact = BitboardBFSPathfinder(self.step_limit, self.coin_reward, self.trash_reward)
+            exact.set_interrupt(self.cancel_token, self.deadline)
+            path = exact.search(state_space, start, goal)
+            self.states_explored += exact.states_explored
+        self.final_path = path
+        return path
+
+    def _hierarchical_search(
+            self,
+            state_space: Grid,
+            start: tuple[int, int],
+            goal: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """
+        A* over the cluster graph from start to goal, refined into a cell path, or [] if none fits the step limit.
+        """
+        if start == goal:
+            return [start]
+        graph = state_space.cluster_graph(self.cluster_size)
+        cols = state_space.cols
+        source, target = start[0] * cols + start[1], goal[0] * cols + goal[1]
+        start_cluster, goal_cluster = graph.cluster_of(source), graph.cluster_of(target)
+        start_distance, start_tree = graph.local_search(source)
+        goal_distance, goal_tree = graph.local_search(target)
+        start_edges = [
+            (entrance, start_distance[graph.local_index(entrance, start_cluster)])
+            for entrance in graph.cluster(start_cluster).crossings
+            if start_distance[graph.local_index(entrance, start_cluster)] >= 0
+        ]
+        if start_cluster == goal_cluster and start_distance[graph.local_index(target, start_cluster)] >= 0:
+            start_edges.append((GOAL, start_distance[graph.local_index(target, start_cluster)]))
+        goal_links = {
+            entrance: goal_distance[graph.local_index(entrance, goal_cluster)]
+            for entrance in graph.cluster(goal_cluster).crossings
+            if goal_distance[graph.local_index(entrance, goal_cluster)] >= 0
+        }
+        frontier = [(manhattan(start, goal), 0, START)]  # Ties go to the deepest node, as open maps tie a lot
+        steps = {START: 0}
+        parents = {START: None}
+        closed = set()
+        while frontier:
+            _, _, node = heapq.heappop(frontier)
+            if node in closed:  # Skip stale entries
+                continue
+            closed.add(node)
+            self.states_explored += 1
+            if not self.states_explored % INTERRUPT_CHECK_INTERVAL:
+                self.check_interrupt()
+            if node == GOAL:  # Goal test
+                return self._refine(graph, parents, start_tree, goal_tree, source, target)
+            if node == START:
+                edges = start_edges
+            else:
+                info = graph.cluster(graph.cluster_of(node))
+                edges = info.edges[node] + [(outside, 1) for outside in info.crossings[node]]
+                if node in goal_links:
+                    edges.append((GOAL, goal_links[node]))
+            for neighbor, cost in edges:
+                new_steps = steps[node] + cost
+                f = new_steps if neighbor == GOAL else new_steps + manhattan(divmod(neighbor, cols), goal)
+                if f > self.step_limit:  # Skip if goal is out of reach
+                    continue
+                if neighbor not in steps or new_steps < steps[neighbor]:
+                    steps[neighbor] = new_steps
+                    parents[neighbor] = node
+                    heapq.heappush(frontier, (f, -new_steps, neighbor))
+        return []
+
+    @staticmethod
+    def _refine(graph, parents: dict, start_tree: bytearray, goal_tree: bytearray, source: int, target: int) -> list:
+        """
+        Expand the abstract path ending at GOAL into (row, col) cells.
+        """
+        abstract = [GOAL]
+        while parents[abstract[-1]] is not None:
+            abstract.append(parents[abstract[-1]])
+        abstract.reverse()
+        path = []
+        for a, b in zip(abstract, abstract[1:]):
+            if a == START:
+                segment = graph.tree_path(start_tree, graph.cluster_of(source), target if b == GOAL else b)
+            elif b == GOAL:
+                segment = list(reversed(graph.tree_path(goal_tree, graph.cluster_of(target), a)))
+            elif graph.cluster_of(a) != graph.cluster_of(b):  # Crossing a cluster border
+                segment = [divmod(a, graph.cols), divmod(b, graph.cols)]
+            else:
+                cluster = graph.cluster_of(a)
+                segment = graph.tree_path(graph.cluster(cluster).trees[a], cluster, b)
+            path.extend(segment[1:] if path else segment)
+        return path
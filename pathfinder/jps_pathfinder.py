@@ -0,0 +1,203 @@
+import numpy as np
+from pathfinder.base_pathfinder import INTERRUPT_CHECK_INTERVAL
+from pathfinder.reward_unaware_pathfinder import RewardUnawarePathfinder
+from pathfinder.frontier import Frontier
+from core.grid import Grid
+from core.grid_analysis import GridAnalysis
+from core.heuristic import manhattan
+
+
+class JumpTables:
+    """
+    Where a straight-line jump from each cell stops in each direction: at a wall, the grid edge or a jump point.
+    """
+    def __init__(self, walkable: np.ndarray):
+        self.walkable = walkable
+        self.rows, self.cols = rows, cols = walkable.shape
+        padded = np.pad(walkable, 1, constant_values=False)
+        up, down = padded[:-2, 1:-1], padded[2:, 1:-1]
+        left, right = padded[1:-1, :-2], padded[1:-1, 2:]
+        # Horizontal jump points have an open cell above or below whose cell one step back is blocked
+        forced_right = walkable & ((up & ~padded[:-2, :-2]) | (down & ~padded[2:, :-2]))
+        forced_left = walkable & ((up & ~padded[:-2, 2:]) | (down & ~padded[2:, 2:]))
+        self.next_right = self._next_stop(forced_right | ~walkable, axis=1, step=1)
+        self.next_left = self._next_stop(forced_left | ~walkable, axis=1, step=-1)
+        found_right = self._succeeds(self.next_right, axis=1)
+        found_left = self._succeeds(self.next_left, axis=1)
+        # Vertical jump points have such a cell to the left or right, or a side cell from which a horizontal jump
+        # succeeds
+        turn = np.zeros_like(walkable)
+        turn[:, :-1] |= found_right[:, 1:]  # Horizontal jump from the right neighbor succeeds
+        turn[:, 1:] |= found_left[:, :-1]
+        forced_down = walkable & ((left & ~padded[:-2, :-2]) | (right & ~padded[:-2, 2:]))
+        forced_up = walkable & ((left & ~padded[2:, :-2]) | (right & ~padded[2:, 2:]))
+        self.next_down = self._next_stop(forced_down | turn | ~walkable, axis=0, step=1)
+        self.next_up = self._next_stop(forced_up | turn | ~walkable, axis=0, step=-1)
+
+    @staticmethod
+    def _next_stop(stops: np.ndarray, axis: int, step: int) -> np.ndarray:
+        """
+        Index along axis of the first stop at or after each cell in the given direction, or one past the edge.
+        """
+        size = stops.shape[axis]
+        index = np.arange(size).reshape((1, -1) if axis == 1 else (-1, 1))
+        if step > 0:
+            positions = np.where(stops, index, size)
+            return np.flip(np.minimum.accumulate(np.flip(positions, axis), axis=axis), axis)
+        return np.maximum.accumulate(np.where(stops, index, -1), axis=axis)
+
+    def _succeeds(self, next_stop: np.ndarray, axis: int) -> np.ndarray:
+        """
+        Whether a jump from each cell stops on an open cell, i.e. finds a jump point.
+        """
+        size = next_stop.shape[axis]
+        inside = (next_stop >= 0) & (next_stop < size)
+        clipped = np.clip(next_stop, 0, size - 1)
+        if axis == 1:
+            landed = np.take_along_axis(self.walkable, clipped, axis=1)
+        else:
+            landed = np.take_along_axis(self.walkable, clipped, axis=0)
+        return inside & landed
+
+
+class JPSPathfinder(RewardUnawarePathfinder):
+    """
+    Jump Point Search pathfinder for the 4-connected grid.
+    """
+    def __init__(self, step_limit: int, coin_reward: int, trash_reward: int):
+        super().__init__(step_limit, coin_reward, trash_reward)
+        self._tables: JumpTables | None = None
+        self._tables_analysis: GridAnalysis | None = None
+
+    def jump_tables(self, state_space: Grid) -> JumpTables:
+        """
+        Get the jump tables of the grid's current layout, rebuilding them only when the layout changes.
+        """
+        self.analysis = GridAnalysis.for_grid(state_space)
+        if self._tables_analysis is not self.analysis:
+            self._tables = JumpTables(self.analysis.walkable)
+            self._tables_analysis = self.analysis
+        return self._tables
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute a path from start to goal in the given state space.
+        """
+        self._jumps = self.jump_tables(state_space)
+        self._goal = goal
+        frontier = Frontier()
+        frontier.push(manhattan(start, goal), start)  # Priority queue of jump points
+        parents = {start: None}
+        steps = {start: 0}
+        closed = set()
+        while frontier:
+            current = frontier.pop()
+            if current in closed:  # Skip stale entries
+                continue
+            closed.add(current)
+            self.states_explored += 1
+            if not self.states_explored % INTERRUPT_CHECK_INTERVAL:
+                self.check_interrupt()
+            if current == goal:  # Goal test
+                self.final_path = self._reconstruct(parents, goal)
+                return self.final_path
+            for jump_point in self._successors(current, parents[current]):
+                new_steps = steps[current] + manhattan(current, jump_point)
+                f = new_steps + manhattan(jump_point, goal)
+                if f > self.step_limit:  # Skip if goal is out of reach
+                    continue
+                if jump_point not in steps or new_steps < steps[jump_point]:
+                    steps[jump_point] = new_steps
+                    parents[jump_point] = current
+                    frontier.push(f, jump_point)
+        self.final_path = []
+        return []
+
+    def _successors(self, node: tuple[int, int], parent: tuple[int, int] | None) -> list[tuple[int, int]]:
+        """
+        Jump from node in every direction not pruned by the direction it was reached from.
+        """
+        row, col = node
+        if parent is None:
+            directions = ((1, 0), (-1, 0), (0, 1), (0, -1))
+        else:
+            dr = (row > parent[0]) - (row < parent[0])
+            dc = (col > parent[1]) - (col < parent[1])
+            if dc:  # Moving horizontally: carry on or turn
+                directions = ((0, dc), (1, 0), (-1, 0))
+            else:  # Moving vertically: carry on or turn
+                directions = ((dr, 0), (0, 1), (0, -1))
+        jump_points = []
+        for dr, dc in directions:
+            if dc:
+                jump_point = self._jump_horizontal(row, col + dc, dc)
+            else:
+                jump_point = self._jump_vertical(row + dr, col, dr)
+            if jump_point is not None:
+                jump_points.append(jump_point)
+        return jump_points
+
+    def _open(self, row: int, col: int) -> bool:
+        jumps = self._jumps
+        return 0 <= row < jumps.rows and 0 <= col < jumps.cols and bool(jumps.walkable[row, col])
+
+    def _horizontal_stop(self, row: int, col: int, dc: int) -> int | None:
+        """
+        Column where a horizontal jump from open cell (row, col) stops, or None if it finds no jump point. The goal is
+        found if it lies before the stop.
+        """
+        jumps = self._jumps
+        stop = int((jumps.next_right if dc > 0 else jumps.next_left)[row, col])
+        goal_row, goal_col = self._goal
+        if goal_row == row and 0 <= (goal_col - col) * dc <= (stop - col) * dc:
+            return goal_col
+        if 0 <= stop < jumps.cols and jumps.walkable[row, stop]:
+            return stop
+        return None
+
+    def _jump_horizontal(self, row: int, col: int, dc: int) -> tuple[int, int] | None:
+        """
+        Slide horizontally from (row, col) to the next jump point, or None at a wall or the grid edge.
+        """
+        if not self._open(row, col):
+            return None
+        stop = self._horizontal_stop(row, col, dc)
+        return (row, stop) if stop is not None else None
+
+    def _jump_vertical(self, row: int, col: int, dr: int) -> tuple[int, int] | None:
+        """
+        Slide vertically from (row, col) to the next jump point, or None at a wall or the grid edge.
+        """
+        if not self._open(row, col):
+            return None
+        jumps = self._jumps
+        stop = int((jumps.next_down if dr > 0 else jumps.next_up)[row, col])
+        goal_row, goal_col = self._goal
+        if 0 <= (goal_row - row) * dr < (stop - row) * dr:  # Passes the goal's row before the stop
+            if goal_col == col:
+                return self._goal
+            for dc in (1, -1):  # Turn towards the goal if a horizontal jump reaches it
+                if (goal_col - col) * dc > 0 and self._open(goal_row, col + dc) \
+                        and self._horizontal_stop(goal_row, col + dc, dc) == goal_col:
+                    return goal_row, col
+        if 0 <= stop < jumps.rows and jumps.walkable[stop, col]:
+            return stop, col
+        return None
+
+    @staticmethod
+    def _reconstruct(parents: dict, goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Expand the chain of jump points ending at goal into a step-by-step path.
+        """
+        path = [goal]
+        node = goal
+        while parents[node] is not None:
+            parent = parents[node]
+            dr = (parent[0] > node[0]) - (parent[0] < node[0])
+            dc = (parent[1] > node[1]) - (parent[1] < node[1])
+            row, col = node
+            while (row, col) != parent:
+                row, col = row + dr, col + dc
+                path.append((row, col))
+            node = parent
+        return list(reversed(path))
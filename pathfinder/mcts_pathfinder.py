@@ -0,0 +1,245 @@
+import math
+import time
+import numpy as np
+from pathfinder.base_pathfinder import RandomizedPathfinder
+from pathfinder.reward_aware_pathfinder import RewardAwarePathfinder
+from core.cancellation import SearchInterrupted
+from core.grid import Grid
+from core.grid_analysis import GridAnalysis
+
+TIME_BUDGET = 0.05  # Default seconds spent searching
+BATCH_SIZE = 32  # Rollouts run together
+EXPLORATION = math.sqrt(2)  # UCT exploration constant, on returns normalized to [0, 1]
+GOAL_BIAS = 4.0  # Rollout weight of moves toward the goal, relative to other moves
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class MCTSPathfinder(RandomizedPathfinder, RewardAwarePathfinder):
+    """
+    Reward-aware Monte Carlo Tree Search over moves, with batched NumPy rollouts that always reach the goal in time.
+    """
+    def __init__(
+            self,
+            step_limit,
+            coin_reward,
+            trash_reward,
+            time_budget: float | None = TIME_BUDGET,
+            rollouts: int | None = None,
+            batch_size: int = BATCH_SIZE,
+            exploration: float = EXPLORATION,
+            goal_bias: float = GOAL_BIAS,
+            seed: int | None = None
+    ):
+        """
+        :param time_budget: Seconds spent searching, or None to run exactly rollouts rollouts
+        :param rollouts: Cap on rollouts, or None for no cap
+        :param batch_size: Rollouts run together
+        :param exploration: UCT exploration constant
+        :param goal_bias: Rollout weight of moves toward the goal relative to other moves
+        :param seed: Seed for reproducible runs
+        """
+        super().__init__(step_limit, coin_reward, trash_reward)
+        if time_budget is None and rollouts is None:
+            raise ValueError("Set a time budget, a number of rollouts, or both")
+        self.time_budget = time_budget
+        self.rollouts = rollouts
+        self.batch_size = batch_size
+        self.exploration = exploration
+        self.goal_bias = goal_bias
+        self.seed = seed
+        self.rollouts_run = 0
+        self.rollouts_per_second = 0.0
+        self.tree_size = 0
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute the best path from start to goal that the search finds.
+        """
+        start_time = time.perf_counter()
+        self.final_path = []
+        self.rollouts_run = 0
+        self.rollouts_per_second = 0.0
+        self.tree_size = 0
+        self.analysis = GridAnalysis.for_grid(state_space)
+        if self.analysis.distance(start, goal) > self.step_limit:  # Goal cannot be reached in time
+            return self.final_path
+        if start == goal:
+            self.final_path = [start]
+            return self.final_path
+        try:
+            self._search(state_space, start, goal, start_time)
+        except SearchInterrupted as interrupted:
+            interrupted.path = self.final_path  # The best path so far is still valid
+            raise
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.rollouts_per_second = self.rollouts_run / elapsed if elapsed > 0 else 0.0
+        return self.final_path
+
+    def _search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int], start_time: float) -> None:
+        """
+        Run batches of selection, rollouts and backpropagation until the budget is used up.
+        """
+        cols = state_space.cols
+        deadline = start_time + self.time_budget if self.time_budget is not None else None
+        rng = np.random.default_rng(self.seed)
+        self._goal = goal[0] * cols + goal[1]
+        self._distance = self.analysis.distance_field(goal).ravel().astype(np.int64)
+        self._neighbors = self._neighbor_table(self.analysis.walkable)
+        reachable = self.analysis.reachable_items(start, goal, self.step_limit)
+        item_rewards = self.item_rewards(self.analysis)
+        self._items = np.full(state_space.rows * cols, -1, dtype=np.int64)  # Reachable item number of each cell
+        for number, item in enumerate(reachable):
+            r, c = self.analysis.items[item]
+            self._items[r * cols + c] = number
+        self._rewards = np.array([item_rewards[item] for item in reachable], dtype=float)
+        # Tree nodes as parallel lists indexed by node id; node 0 is the root
+        self._parents, self._positions, self._steps, self._scores = [-1], [start[0] * cols + start[1]], [0], [0.0]
+        self._collected = [np.zeros(len(reachable), dtype=bool)]
+        self._children: list[list[int] | None] = [None]  # None until expanded
+        self._visits, self._values = [0], [0.0]
+        self._low, self._high = math.inf, -math.inf  # Range of returns seen, for normalization
+        best = None
+        while self.rollouts is None or self.rollouts_run < self.rollouts:
+            if self.rollouts_run and deadline is not None and time.perf_counter() >= deadline:
+                break
+            self.check_interrupt()
+            batch = self.batch_size if self.rollouts is None else min(self.batch_size, self.rollouts - self.rollouts_run)
+            leaves = [self._select(rng) for _ in range(batch)]
+            returns, lengths, trails = self._rollout(leaves, rng)
+            self.rollouts_run += batch
+            self.states_explored += int(lengths.sum())
+            for leaf, value, length, trail in zip(leaves, returns, lengths, trails):
+                self._low, self._high = min(self._low, value), max(self._high, value)
+                self._backpropagate(leaf, float(value))
+                steps = self._steps[leaf] + int(length)
+                if best is None or (value, -steps) > best:
+                    best = (value, -steps)
+                    self.final_path = [divmod(int(pos), cols) for pos in self._tree_path(leaf) + list(trail[:length])]
+        self.tree_size = len(self._parents)
+
+    @staticmethod
+    def _neighbor_table(walkable: np.ndarray) -> np.ndarray:
+        """
+        Get the flat index of each cell's walkable neighbor in every direction, or -1 where there is none.
+        """
+        rows, cols = walkable.shape
+        r, c = np.divmod(np.arange(rows * cols), cols)
+        table = np.full((rows * cols, len(DIRECTIONS)), -1, dtype=np.int64)
+        flat = walkable.ravel()
+        for d, (dr, dc) in enumerate(DIRECTIONS):
+            nr, nc = r + dr, c + dc
+            inside = (0 <= nr) & (nr < rows) & (0 <= nc) & (nc < cols)
+            index = np.where(inside, nr * cols + nc, 0)
+            table[:, d] = np.where(inside & flat[index], index, -1)
+        return table
+
+    def _select(self, rng) -> int:
+        """
+        Walk down the tree by UCT to a leaf, expanding it, and count a virtual visit on every node passed.
+        """
+        node = 0
+        self._visits[node] += 1
+        while self._positions[node] != self._goal:
+            children = self._children[node]
+            if children is None:
+                children = self._children[node] = self._expand(node, rng)
+            unvisited = next((child for child in children if not self._visits[child]), None)
+            if unvisited is not None:
+                node = unvisited
+                self._visits[node] += 1
+                break
+            node = max(children, key=lambda child: self._uct(node, child))
+            self._visits[node] += 1
+        return node
+
+    def _uct(self, parent: int, child: int) -> float:
+        """
+        UCT value of a visited child.
+        """
+        visits = self._visits[child]
+        mean = self._values[child] / visits
+        spread = self._high - self._low
+        normalized = (mean - self._low) / spread if spread > 0 else 0.5
+        return normalized + self.exploration * math.sqrt(math.log(self._visits[parent]) / visits)
+
+    def _expand(self, node: int, rng) -> list[int]:
+        """
+        Add a child for every move from node that keeps the goal within reach, in random order.
+        """
+        steps = self._steps[node] + 1
+        children = []
+        for neighbor in rng.permutation(self._neighbors[self._positions[node]]):
+            if neighbor < 0 or steps + self._distance[neighbor] > self.step_limit:
+                continue
+            score = self._scores[node]
+            collected = self._collected[node]
+            item = self._items[neighbor]
+            if item >= 0 and not collected[item]:
+                score += self._rewards[item]
+                collected = collected.copy()
+                collected[item] = True
+            children.append(len(self._parents))
+            self._parents.append(node)
+            self._positions.append(int(neighbor))
+            self._steps.append(steps)
+            self._scores.append(score)
+            self._collected.append(collected)
+            self._children.append(None)
+            self._visits.append(0)
+            self._values.append(0.0)
+        return children
+
+    def _rollout(self, leaves: list[int], rng) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Play every leaf out to the goal at once.
+
+        :return: (returns, rollout lengths, positions visited by each rollout)
+        """
+        count = len(leaves)
+        positions = np.array([self._positions[leaf] for leaf in leaves], dtype=np.int64)
+        steps = np.array([self._steps[leaf] for leaf in leaves], dtype=np.int64)
+        returns = np.array([self._scores[leaf] for leaf in leaves], dtype=float)
+        collected = np.stack([self._collected[leaf] for leaf in leaves])
+        lengths = np.zeros(count, dtype=np.int64)
+        trails = np.zeros((count, self.step_limit), dtype=np.int64)
+        rows = np.flatnonzero(positions != self._goal)
+        while rows.size:
+            neighbors = self._neighbors[positions[rows]]
+            distance = np.where(neighbors >= 0, self._distance[neighbors], np.iinfo(np.int64).max // 2)
+            feasible = steps[rows, None] + 1 + distance <= self.step_limit
+            closer = distance < self._distance[positions[rows], None]
+            weights = np.where(feasible, np.where(closer, self.goal_bias, 1.0), 0.0).cumsum(axis=1)
+            draw = rng.random(rows.size) * weights[:, -1]
+            moves = (weights <= draw[:, None]).sum(axis=1)
+            chosen = neighbors[np.arange(rows.size), moves]
+            items = self._items[chosen]
+            gets = items >= 0
+            gets[gets] = ~collected[rows[gets], items[gets]]
+            returns[rows[gets]] += self._rewards[items[gets]]
+            collected[rows[gets], items[gets]] = True
+            trails[rows, lengths[rows]] = chosen
+            lengths[rows] += 1
+            steps[rows] += 1
+            positions[rows] = chosen
+            rows = rows[chosen != self._goal]
+        return returns, lengths, trails
+
+    def _backpropagate(self, leaf: int, value: float) -> None:
+        """
+        Add a rollout's return to the leaf and its ancestors, whose visits were counted during selection.
+        """
+        node = leaf
+        while node >= 0:
+            self._values[node] += value
+            node = self._parents[node]
+
+    def _tree_path(self, node: int) -> list[int]:
+        """
+        Get the flat positions from the root to node.
+        """
+        path = []
+        while node >= 0:
+            path.append(self._positions[node])
+            node = self._parents[node]
+        return path[::-1]
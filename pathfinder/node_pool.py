@@ -0,0 +1,83 @@
+from array import array
+
+NO_PARENT = -1  # Parent handle of the root node
+
+
+class NodePool:
+    """
+    Search nodes stored as parallel arrays and referred to by integer handles.
+
+    Each node holds a position id (row * cols + col), score, step count, collected mask id and parent handle, so a
+    node costs a few machine words instead of a dict. Collected masks are interned: nodes that collected the same
+    items share one mask id, and two states are equal exactly when their position and mask ids are.
+
+    Nodes a search discards without expanding have no children, so their slots are released and reused.
+    """
+    def __init__(self, cols: int, integer_scores: bool = True):
+        """
+        :param cols: Number of grid columns, used to map positions to ids
+        :param integer_scores: Store scores as 64-bit integers, otherwise as floats
+        """
+        self.cols = cols
+        self.pos_ids = array('q')
+        self.scores = array('q' if integer_scores else 'd')
+        self.steps = array('l')
+        self.mask_ids = array('l')
+        self.parents = array('q')
+        self.masks: list[int] = []
+        self._mask_index: dict[int, int] = {}
+        self._free: list[int] = []
+
+    def intern_mask(self, mask: int) -> int:
+        """
+        Get the id of a collected mask, assigning the next id to masks not seen before.
+        """
+        mask_id = self._mask_index.get(mask)
+        if mask_id is None:
+            mask_id = self._mask_index[mask] = len(self.masks)
+            self.masks.append(mask)
+        return mask_id
+
+    def add(self, pos: tuple[int, int], score: float, steps: int, mask_id: int, parent: int = NO_PARENT) -> int:
+        """
+        Store a node and return its handle.
+        """
+        if self._free:
+            node = self._free.pop()
+            self.pos_ids[node] = pos[0] * self.cols + pos[1]
+            self.scores[node] = score
+            self.steps[node] = steps
+            self.mask_ids[node] = mask_id
+            self.parents[node] = parent
+            return node
+        self.pos_ids.append(pos[0] * self.cols + pos[1])
+        self.scores.append(score)
+        self.steps.append(steps)
+        self.mask_ids.append(mask_id)
+        self.parents.append(parent)
+        return len(self.parents) - 1
+
+    def release(self, node: int) -> None:
+        """
+        Free the slot of a node that has no children and is no longer referenced.
+        """
+        self._free.append(node)
+
+    def position(self, node: int) -> tuple[int, int]:
+        """
+        Get the (row, col) position of a node.
+        """
+        return divmod(self.pos_ids[node], self.cols)
+
+    def path(self, node: int) -> list[tuple[int, int]]:
+        """
+        Reconstruct the path from the root to a node.
+        """
+        path = []
+        while node != NO_PARENT:
+            path.append(divmod(self.pos_ids[node], self.cols))
+            node = self.parents[node]
+        return list(reversed(path))
+
+    def __len__(self) -> int:
+        return len(self.parents) - len(self._free)
@@ -0,0 +1,148 @@
+import time
+import numpy as np
+from pathfinder.base_pathfinder import RandomizedPathfinder
+from pathfinder.reward_aware_pathfinder import RewardAwarePathfinder
+from pathfinder.waypoint_space import WaypointSpace
+from pathfinder import worker_pool
+from core.cancellation import SearchInterrupted
+from core.grid import Grid
+from core.grid_analysis import GridAnalysis
+
+TIME_BUDGET = 0.05  # Default seconds each worker spends annealing
+TEMPERATURES = (0.05, 0.1, 0.2, 0.35, 0.6, 1.0, 1.6, 2.5, 4.0, 6.0)  # Replica temperatures per unit of reward
+SWAP_INTERVAL = 1  # Sweeps between temperature swap attempts
+MAX_SHORTCUT = 3  # Most waypoints one shortcut skips
+MUTATIONS = ('splice', 'detour', 'shortcut')
+
+
+class ParallelTemperingPathfinder(RandomizedPathfinder, RewardAwarePathfinder):
+    """
+    Reward-aware parallel tempering over whole paths through item waypoints, run across worker processes.
+    """
+    def __init__(
+            self,
+            step_limit,
+            coin_reward,
+            trash_reward,
+            time_budget: float | None = TIME_BUDGET,
+            sweeps: int | None = None,
+            workers: int | None = None,
+            temperatures: tuple[float, ...] = TEMPERATURES,
+            swap_interval: int = SWAP_INTERVAL,
+            seed: int | None = None
+    ):
+        """
+        :param time_budget: Seconds each worker spends annealing, or None to run exactly sweeps sweeps
+        :param sweeps: Cap on sweeps across all workers, or None for no cap
+        :param workers: Worker processes, defaulting to the CPU count. 1 anneals in this process.
+        :param temperatures: Replica temperatures per unit of reward, one replica each
+        :param swap_interval: Sweeps between temperature swap attempts
+        :param seed: Seed for reproducible runs
+        """
+        super().__init__(step_limit, coin_reward, trash_reward)
+        if time_budget is None and sweeps is None:
+            raise ValueError("Set a time budget, a number of sweeps, or both")
+        if not temperatures or min(temperatures) <= 0:
+            raise ValueError(f"Temperatures must be positive, got {temperatures}")
+        self.time_budget = time_budget
+        self.sweeps = sweeps
+        self.workers = workers or worker_pool.default_workers()
+        self.temperatures = tuple(sorted(temperatures))
+        self.swap_interval = swap_interval
+        self.seed = seed
+        self.sweeps_run = 0  # Sweeps run by the last search, across all workers
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute the best path from start to goal that the annealing finds.
+        """
+        self.final_path = []
+        self.final_path, self.sweeps_run = worker_pool.run_search(self, '_anneal', state_space, start, goal,
+                                                                  self.sweeps)
+        return self.final_path
+
+    def _anneal(self, state_space, start, goal, seed, time_budget, sweeps) -> tuple:
+        """
+        Run the replicas until the time budget or sweeps run out, returning (score, path, sweeps, states explored).
+        """
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None  # Covers setup too
+        rng = np.random.default_rng(seed)
+        self.analysis = GridAnalysis.for_grid(state_space)
+        if self.analysis.distance(start, goal) > self.step_limit:  # Goal cannot be reached in time
+            return None, [], 0, self.states_explored
+        space = WaypointSpace(state_space, self.analysis, start, goal, self.item_rewards(self.analysis),
+                              self.step_limit, deadline=deadline, check_interrupt=self.check_interrupt)
+        scale = float(np.abs(space.rewards).max(initial=0)) or 1.0
+        temperatures = np.array(self.temperatures) * scale
+        penalty = scale + 1  # Per step over the limit, so no item is worth an extra step over it
+        replicas = [[] for _ in temperatures]  # Every replica starts on the shortest path
+        steps, scores = space.evaluate(space.pack(replicas))
+        energy = scores - penalty * np.maximum(steps - self.step_limit, 0)
+        best_score, best_steps, best_path = float(scores[0]), int(steps[0]), []
+        sweep = 0
+        try:
+            while sweeps is None or sweep < sweeps:
+                if sweep and deadline is not None and time.perf_counter() >= deadline:
+                    break
+                self.check_interrupt()
+                sweep += 1
+                self.states_explored += len(replicas)
+                proposals = [self._mutate(path, replicas, space, rng) for path in replicas]
+                new_steps, new_scores = space.evaluate(space.pack(proposals))
+                new_energy = new_scores - penalty * np.maximum(new_steps - self.step_limit, 0)
+                for i in np.flatnonzero(new_steps <= self.step_limit):
+                    if (new_scores[i], -new_steps[i]) > (best_score, -best_steps):
+                        best_score, best_steps, best_path = float(new_scores[i]), int(new_steps[i]), proposals[i]
+                gain = np.minimum(new_energy - energy, 0)
+                accept = rng.random(len(replicas)) < np.exp(gain / temperatures)  # Metropolis rule
+                for i in np.flatnonzero(accept):
+                    replicas[i] = proposals[i]
+                energy = np.where(accept, new_energy, energy)
+                if sweep % self.swap_interval == 0:
+                    self._swap(replicas, energy, temperatures, sweep % 2, rng)
+        except SearchInterrupted as interrupted:
+            interrupted.path = space.expand(best_path)  # The best path so far is still valid
+            raise
+        return best_score, space.expand(best_path), sweep, self.states_explored
+
+    @staticmethod
+    def _swap(replicas: list, energy: np.ndarray, temperatures: np.ndarray, parity: int, rng) -> None:
+        """
+        Offer neighboring replicas, alternating between even and odd pairs, a swap of their paths.
+        """
+        for i in range(parity, len(replicas) - 1, 2):
+            delta = (1 / temperatures[i] - 1 / temperatures[i + 1]) * (energy[i + 1] - energy[i])
+            if delta >= 0 or rng.random() < np.exp(delta):
+                replicas[i], replicas[i + 1] = replicas[i + 1], replicas[i]
+                energy[i], energy[i + 1] = energy[i + 1], energy[i]
+
+    @staticmethod
+    def _mutate(path: list[int], replicas: list, space: WaypointSpace, rng) -> list[int]:
+        """
+        Propose a random splice, detour or shortcut of a path.
+        """
+        unvisited = [node for node in range(space.size) if node not in path] if space.size > len(path) else []
+        donors = [donor for donor in replicas if donor]
+        moves = [move for move, ok in zip(MUTATIONS, (donors, unvisited, path)) if ok]
+        if not moves:
+            return path
+        move = moves[rng.integers(len(moves))]
+        if move == 'detour':  # Visit a new item where it adds the fewest steps
+            item = unvisited[rng.integers(len(unvisited))]
+            before = [space.start] + path
+            after = path + [space.goal]
+            added = space.distances[before, item] + space.distances[item, after] - space.distances[before, after]
+            position = int(np.argmin(added))
+            return path[:position] + [item] + path[position:]
+        if move == 'shortcut':  # Skip a run of waypoints
+            i = int(rng.integers(len(path)))
+            j = i + int(rng.integers(1, min(MAX_SHORTCUT, len(path) - i) + 1))
+            return path[:i] + path[j:]
+        donor = donors[rng.integers(len(donors))]  # Replace a run of waypoints with one from another replica
+        a = int(rng.integers(len(donor)))
+        b = a + int(rng.integers(1, len(donor) - a + 1))
+        i = int(rng.integers(len(path) + 1))
+        j = i + int(rng.integers(len(path) - i + 1))
+        spliced = path[:i] + donor[a:b] + path[j:]
+        return list(dict.fromkeys(spliced))  # Keep the first visit of each item
+
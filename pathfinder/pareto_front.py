@@ -0,0 +1,56 @@
+from bisect import bisect_right
+
+
+class ParetoFront:
+    """
+    Best goal-reaching score for every step budget up to a maximum step limit, computed in a single search.
+
+    Each entry is a path that beats the score of every shorter entry, so the best path for any step limit at or below
+    max_step_limit is the last entry whose step count fits.
+    """
+    def __init__(self, max_step_limit: int, entries: list[tuple[int, float, list[tuple[int, int]]]]):
+        """
+        :param max_step_limit: Largest step limit the search covered
+        :param entries: (steps, score, path) for goal-reaching paths, in any order
+        """
+        self.max_step_limit = max_step_limit
+        self.steps: list[int] = []
+        self.scores: list[float] = []
+        self.paths: list[tuple[tuple[int, int], ...]] = []
+        for steps, score, path in sorted(entries, key=lambda e: (e[0], -e[1])):
+            if not self.scores or score > self.scores[-1]:  # Keep only entries that improve on every shorter one
+                self.steps.append(steps)
+                self.scores.append(score)
+                self.paths.append(tuple(path))
+
+    @property
+    def size(self) -> int:
+        """
+        Total number of path cells stored.
+        """
+        return sum(len(path) for path in self.paths)
+
+    def covers(self, step_limit: int) -> bool:
+        """
+        Determine if the front can answer a step limit.
+        """
+        return step_limit <= self.max_step_limit
+
+    def best(self, step_limit: int) -> list[tuple[int, int]]:
+        """
+        Get the highest-scoring path within step_limit, or [] if the goal cannot be reached in time.
+        """
+        if not self.covers(step_limit):
+            raise ValueError(f"Step limit {step_limit} exceeds the front's maximum of {self.max_step_limit}")
+        i = bisect_right(self.steps, step_limit)
+        return list(self.paths[i - 1]) if i else []
+
+    def best_score(self, step_limit: int) -> float | None:
+        """
+        Get the best score within step_limit, or None if the goal cannot be reached in time.
+        """
+        i = bisect_right(self.steps, min(step_limit, self.max_step_limit))
+        return self.scores[i - 1] if i else None
+
+    def __len__(self) -> int:
+        return len(self.steps)
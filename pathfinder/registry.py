@@ -0,0 +1,93 @@
+from importlib import import_module
+from importlib.metadata import entry_points
+
+ENTRY_POINT_GROUP = "grid_runner.pathfinders"
+
+"""
+Built-in pathfinders, keyed by name and stored as 'module:Class' import paths so nothing is imported until used.
+"""
+BUILTIN_PATHFINDERS = {
+    "ASTAR": "pathfinder.reward_astar_pathfinder:RewardAStarPathfinder",
+    "UCS": "pathfinder.ucs_pathfinder:UCSPathfinder",
+    "GREEDY_SEARCH": "pathfinder.reward_greedy_best_first_pathfinder:RewardGreedyBestFirstPathfinder",
+    "BFS": "pathfinder.bfs_pathfinder:BFSPathfinder",
+    "RANDOMIZED_HILL_CLIMBING": "pathfinder.reward_randomized_hill_climbing_pathfinder:"
+                                "RewardRandomizedHillClimbingPathfinder",
+    "SIMULATED_ANNEALING": "pathfinder.reward_simulated_annealing_pathfinder:RewardSimulatedAnnealingPathfinder",
+    "BFS_BITBOARD": "pathfinder.bitboard_bfs_pathfinder:BitboardBFSPathfinder",
+    "JPS": "pathfinder.jps_pathfinder:JPSPathfinder",
+    "HPA_STAR": "pathfinder.hpa_pathfinder:HPAPathfinder",
+    "ANYTIME_ASTAR": "pathfinder.anytime_astar_pathfinder:AnytimeRewardAStarPathfinder",
+    "BEAM_SEARCH": "pathfinder.beam_search_pathfinder:BeamSearchPathfinder",
+    "SMA_STAR": "pathfinder.sma_star_pathfinder:SMAStarPathfinder",
+    "RESTART_HILL_CLIMBING": "pathfinder.restart_hill_climbing_pathfinder:RestartHillClimbingPathfinder",
+    "PARALLEL_TEMPERING": "pathfinder.parallel_tempering_pathfinder:ParallelTemperingPathfinder",
+    "GENETIC": "pathfinder.genetic_pathfinder:GeneticPathfinder",
+    "MCTS": "pathfinder.mcts_pathfinder:MCTSPathfinder",
+}
+
+_import_paths: dict[str, str] = dict(BUILTIN_PATHFINDERS)
+_loaded: dict[str, type] = {}
+_entry_points_scanned = False
+
+
+def register(name: str, pathfinder: str | type) -> None:
+    """
+    Register a pathfinder under a name.
+
+    :param name: Registry name, e.g. 'ASTAR'
+    :param pathfinder: 'module:Class' import path (loaded on first use) or a pathfinder class
+    """
+    _loaded.pop(name, None)
+    if isinstance(pathfinder, str):
+        _import_paths[name] = pathfinder
+    else:
+        _import_paths.pop(name, None)
+        _loaded[name] = pathfinder
+
+
+def _scan_entry_points() -> None:
+    """
+    Add third-party pathfinders advertised under the entry point group. Built-in names are never overridden.
+    """
+    global _entry_points_scanned
+    if _entry_points_scanned:
+        return
+    _entry_points_scanned = True
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name not in _import_paths and entry_point.name not in _loaded:
+            _import_paths[entry_point.name] = entry_point.value
+
+
+def _import(import_path: str) -> type:
+    """
+    Import a class from a 'module:Class' path.
+    """
+    module_name, _, attr = import_path.partition(":")
+    obj = import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def get_pathfinder(name: str) -> type:
+    """
+    Get pathfinder class by name, importing its module on first use.
+    """
+    if name in _loaded:
+        return _loaded[name]
+    if name not in _import_paths:
+        _scan_entry_points()
+    if name not in _import_paths:
+        raise KeyError(f"Unknown pathfinder '{name}'. Available: {', '.join(available())}")
+    pathfinder = _import(_import_paths[name])
+    _loaded[name] = pathfinder
+    return pathfinder
+
+
+def available() -> list[str]:
+    """
+    Get names of all registered pathfinders, including entry point plugins.
+    """
+    _scan_entry_points()
+    return sorted(set(_import_paths) | set(_loaded))
@@ -0,0 +1,138 @@
+import random
+import time
+from collections import deque
+from pathfinder.reward_randomized_hill_climbing_pathfinder import RewardRandomizedHillClimbingPathfinder
+from pathfinder.base_pathfinder import INTERRUPT_CHECK_INTERVAL
+from pathfinder import worker_pool
+from core.cancellation import SearchInterrupted
+from core.grid import Grid, NO_ITEM
+from core.grid_analysis import GridAnalysis
+
+TIME_BUDGET = 0.05  # Default seconds each worker spends climbing
+MAX_SIDEWAYS = 8  # Consecutive moves that do not improve the evaluation before a climb gives up
+TABU_TENURE = 8  # Recent cells a climb may not step back onto
+NOISE = 0.1  # Probability of a random move instead of the best one
+
+
+class RestartHillClimbingPathfinder(RewardRandomizedHillClimbingPathfinder):
+    """
+    Reward-aware hill climbing with random restarts, sideways moves and a tabu list, run across worker processes.
+    """
+    def __init__(
+            self,
+            step_limit,
+            coin_reward,
+            trash_reward,
+            heuristic=None,
+            time_budget: float | None = TIME_BUDGET,
+            restarts: int | None = None,
+            workers: int | None = None,
+            max_sideways: int = MAX_SIDEWAYS,
+            tabu_tenure: int = TABU_TENURE,
+            noise: float = NOISE,
+            seed: int | None = None
+    ):
+        """
+        :param time_budget: Seconds each worker spends climbing, or None to run exactly restarts climbs
+        :param restarts: Cap on climbs across all workers, or None for no cap
+        :param workers: Worker processes, defaulting to the CPU count. 1 climbs in this process.
+        :param max_sideways: Consecutive non-improving moves allowed
+        :param tabu_tenure: Recently visited cells a climb may not revisit
+        :param noise: Probability of a random move
+        :param seed: Seed for reproducible restarts
+        """
+        super().__init__(step_limit, coin_reward, trash_reward, heuristic)
+        if time_budget is None and restarts is None:
+            raise ValueError("Set a time budget, a number of restarts, or both")
+        self.time_budget = time_budget
+        self.restarts = restarts
+        self.workers = workers or worker_pool.default_workers()
+        self.max_sideways = max_sideways
+        self.tabu_tenure = tabu_tenure
+        self.noise = noise
+        self.seed = seed
+        self.climbs = 0  # Climbs run by the last search, across all workers
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute the best path from start to goal that the restarts find.
+        """
+        self.final_path = []
+        self.final_path, self.climbs = worker_pool.run_search(self, '_climb_until', state_space, start, goal,
+                                                              self.restarts)
+        return self.final_path
+
+    def _climb_until(self, state_space, start, goal, seed, time_budget, restarts) -> tuple:
+        """
+        Run climbs until the time budget or restarts run out, returning (score, path, climbs, states explored).
+        """
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        rng = random.Random(seed)
+        self.analysis = GridAnalysis.for_grid(state_space)
+        goal_distance = self.analysis.distance_field(goal)
+        best_score, best_path, climbs = None, [], 0
+        if goal_distance[start] > self.step_limit:  # Goal cannot be reached in time
+            return best_score, best_path, climbs, self.states_explored
+        item_rewards = self.item_rewards(self.analysis)
+        heuristic = self.analysis.heuristic_rows(self.heuristic, goal)
+        try:
+            while restarts is None or climbs < restarts:
+                if climbs and deadline is not None and time.perf_counter() >= deadline:
+                    break
+                climbs += 1
+                score, path = self._climb(state_space, start, goal, goal_distance, heuristic, item_rewards, rng)
+                if path and (best_score is None or (score, -len(path)) > (best_score, -len(best_path))):
+                    best_score, best_path = score, path
+        except SearchInterrupted as interrupted:
+            interrupted.path = best_path  # The best path so far is still valid
+            raise
+        return best_score, best_path, climbs, self.states_explored
+
+    def _climb(self, state_space, start, goal, goal_distance, heuristic, item_rewards, rng) -> tuple:
+        """
+        One randomized climb from start, returning (score, path) with path [] if it stopped short of the goal.
+        """
+        item_index = state_space.item_index
+        current = start
+        path = [current]
+        score = 0
+        collected_mask = 0
+        sideways = 0
+        tabu = deque([current], maxlen=self.tabu_tenure) if self.tabu_tenure else ()
+        current_value = -heuristic[current[0]][current[1]]
+        while current != goal:
+            self.states_explored += 1
+            if not self.states_explored % INTERRUPT_CHECK_INTERVAL:
+                self.check_interrupt()
+            steps = len(path)  # Steps taken once the next move is made
+            candidates = []
+            for neighbor in state_space.get_adjacent(*current):
+                if steps + int(goal_distance[neighbor]) > self.step_limit or neighbor in tabu:
+                    continue
+                item = int(item_index[neighbor])
+                reward = 0
+                if item != NO_ITEM and not (collected_mask >> item) & 1:
+                    reward = item_rewards[item]
+                candidates.append((reward - heuristic[neighbor[0]][neighbor[1]], neighbor, item, reward))
+            if not candidates:
+                return score, []
+            if rng.random() < self.noise:
+                value, neighbor, item, reward = rng.choice(candidates)
+            else:
+                rng.shuffle(candidates)  # Break ties at random
+                value, neighbor, item, reward = max(candidates, key=lambda candidate: candidate[0])
+                if value < current_value:  # Local optimum
+                    return score, []
+                sideways = sideways + 1 if value == current_value else 0
+                if sideways > self.max_sideways:  # Plateau
+                    return score, []
+            if reward:
+                collected_mask |= 1 << item
+                score += reward
+            current = neighbor
+            current_value = -heuristic[current[0]][current[1]]  # Its reward is collected
+            path.append(current)
+            if self.tabu_tenure:
+                tabu.append(current)
+        return score, path
+
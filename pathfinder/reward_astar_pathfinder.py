@@ -1,93 +1,111 @@
-import heapq
 from pathfinder.reward_aware_pathfinder import RewardAwarePathfinder
-from core.grid import Grid
-from enums.game_object import GameObject
-from itertools import count
+from pathfinder.base_pathfinder import INTERRUPT_CHECK_INTERVAL
+from core.grid import Grid, NO_ITEM
+from core.heuristic import manhattan
+from core.grid_analysis import GridAnalysis
+from pathfinder.frontier import Frontier
+from pathfinder.pareto_front import ParetoFront
+from pathfinder.reward_bound import RewardBound
 
 
 class RewardAStarPathfinder(RewardAwarePathfinder):
     """
     Reward-aware A* Search pathfinder.
     """
+    supports_front = True
+
     def __init__(self, step_limit, coin_reward, trash_reward, heuristic=None, reward_weight=1.0):
         super().__init__(step_limit, coin_reward, trash_reward)
         self.heuristic = heuristic or self.manhattan
         self.reward_weight = reward_weight
 
-    @staticmethod
-    def manhattan(a: tuple[int, int], b: tuple[int, int]) -> int:
-        """
-        Returns Manhattan distance between a and b.
-        """
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    manhattan = staticmethod(manhattan)
 
-    @staticmethod
-    def pos_to_bit(row: int, col: int, cols: int) -> int:
+    def parameters(self) -> tuple:
         """
-        Return bitmask for grid position.
+        Get the parameters other than step limit that determine this pathfinder's result.
         """
-        return 1 << (row * cols + col)
+        return super().parameters() + (self.heuristic, self.reward_weight)
 
     def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
         """
         Compute a path from start to goal in the given state space.
         """
-        initial = {
-            'pos': start,
-            'score': 0,
-            'steps': 0,
-            'collected_mask': 0,
-            'parent': None
-        }
-        frontier = []
-        counter = count()
-        heapq.heappush(frontier, (0, next(counter), initial))  # Priority queue is frontier
+        self.final_path = self.search_front(state_space, start, goal, self.step_limit).best(self.step_limit)
+        return self.final_path
+
+    def search_front(
+            self,
+            state_space: Grid,
+            start: tuple[int, int],
+            goal: tuple[int, int],
+            max_step_limit: int
+    ) -> ParetoFront:
+        """
+        Compute the best path from start to goal for every step limit up to max_step_limit in a single search.
+        """
+        self.analysis = GridAnalysis.for_grid(state_space)  # Reward-independent, reused across reward changes
+        goal_distance = self.analysis.distance_field(goal)
+        heuristic = self.analysis.heuristic_rows(self.heuristic, goal)  # Read per node instead of calling
+        item_index = state_space.item_index
+        item_rewards = self.item_rewards(self.analysis)
+        pool = self.new_node_pool(state_space.cols)
+        cells = state_space.rows * state_space.cols
+        goal_nodes = {}  # Track best goal node per step count
+        if goal_distance[start] > max_step_limit:  # Goal cannot be reached in time
+            return self.build_front(pool, goal_nodes, max_step_limit)
+        bound = RewardBound(self.analysis, item_rewards, start, goal, max_step_limit)
+        initial = pool.add(start, 0, 0, pool.intern_mask(0))
+        frontier = Frontier()
+        frontier.push(0, initial)  # Priority queue is frontier
         visited = {}
-        best_goal_score = float('-inf')  # Track best score
-        best_goal_node = None  # Track best node
         while frontier:
             self.states_explored += 1
-            _, _, node = heapq.heappop(frontier)  # Pop node from frontier
-            pos = node['pos']
-            score = node['score']
-            steps = node['steps']
-            collected_mask = node['collected_mask']
-            if pos == goal and steps <= self.step_limit:  # Goal test
-                if score > best_goal_score:  # Skip state if no improvement
-                    best_goal_score = score
-                    best_goal_node = node
+            if not self.states_explored % INTERRUPT_CHECK_INTERVAL:
+                self.check_interrupt()
+            node = frontier.pop()  # Pop node from frontier
+            pos = pool.position(node)
+            score = pool.scores[node]
+            steps = pool.steps[node]
+            mask_id = pool.mask_ids[node]
+            collected_mask = pool.masks[mask_id]
+            if pos == goal and steps <= max_step_limit:  # Goal test
+                best = goal_nodes.get(steps)
+                if best is None or score > pool.scores[best]:  # Skip state if no improvement
+                    goal_nodes[steps] = node
+                    bound.record(steps, score)
+                    if best is not None:
+                        pool.release(best)  # Goal nodes are never expanded, so have no children
+                else:
+                    pool.release(node)
                 continue
-            if steps > self.step_limit:  # Skip invalid nodes
+            if steps > max_step_limit:  # Skip invalid nodes
+                pool.release(node)
                 continue
-            state_key = (pos, collected_mask)
+            if bound.prunes(pool.pos_ids[node], steps, score, collected_mask):  # Cannot beat a known goal path
+                pool.release(node)
+                continue
+            state_key = mask_id * cells + pool.pos_ids[node]  # Interned mask ids identify collected masks
             if state_key in visited:  # Skip state if no improvement
                 prev_score, prev_steps = visited[state_key]
                 if score <= prev_score and steps >= prev_steps:
+                    pool.release(node)
                     continue
             visited[state_key] = (score, steps)
             for neighbor in state_space.get_adjacent(*pos):
-                r, c = neighbor
-                cell_type = state_space.get_cell_type(r, c)
-                bit = self.pos_to_bit(r, c, state_space.cols)  # Use bit masking to quickly check and modify grid
+                if steps + 1 + int(goal_distance[neighbor]) > max_step_limit:  # Skip if goal is out of reach
+                    continue
+                item = int(item_index[neighbor])
                 reward = 0
-                new_mask = collected_mask
-                if cell_type in (GameObject.COIN, GameObject.TRASH) and not (collected_mask & bit):
-                    reward = self.get_reward(cell_type)  # Add reward if not yet collected
-                    new_mask |= bit  # Mark item as collected
-                new_node = {
-                    'pos': neighbor,
-                    'score': score + reward,
-                    'steps': steps + 1,
-                    'collected_mask': new_mask,
-                    'parent': node
-                }
+                new_mask_id = mask_id
+                if item != NO_ITEM and not (collected_mask >> item) & 1:  # Masks have one bit per item number
+                    reward = item_rewards[item]  # Add reward if not yet collected
+                    new_mask_id = pool.intern_mask(collected_mask | (1 << item))  # Mark item as collected
+                new_score = score + reward
+                new_node = pool.add(neighbor, new_score, steps + 1, new_mask_id, node)
                 # Calculate f(n) with reward-aware heuristic
-                f = new_node['steps'] + self.heuristic(neighbor, goal) - (self.reward_weight * new_node['score'])
-                heapq.heappush(frontier, (f, next(counter), new_node))  # Push neighbors to pqueue
-        if best_goal_node:
-            self.final_path = self.reconstruct_path(best_goal_node)
-            return self.final_path
-        self.final_path = []
-        return []
+                f = steps + 1 + heuristic[neighbor[0]][neighbor[1]] - (self.reward_weight * new_score)
+                frontier.push(f, new_node)  # Push neighbors to pqueue
+        return self.build_front(pool, goal_nodes, max_step_limit)
 
 
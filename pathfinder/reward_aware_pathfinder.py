@@ -1,7 +1,11 @@
 from abc import abstractmethod
+import numpy as np
 from pathfinder.base_pathfinder import BasePathfinder
 from core.grid import Grid
+from core.grid_analysis import GridAnalysis, TableRows
 from enums.game_object import GameObject
+from pathfinder.node_pool import NodePool
+from pathfinder.pareto_front import ParetoFront
 
 
 class RewardAwarePathfinder(BasePathfinder):
@@ -19,32 +23,54 @@ class RewardAwarePathfinder(BasePathfinder):
             return self.trash_reward
         return 0
 
-    @staticmethod
-    def build_initial_node(start: tuple[int, int]) -> dict:
+    def item_rewards(self, analysis: GridAnalysis) -> list[int]:
         """
-        :param start: start state.
-        :return: initial search node.
+        :param analysis: analysis of the grid being searched.
+        :return: reward value of each item, indexed by item number.
         """
-        return {
-            'pos': start,
-            'score': 0,
-            'steps': 0,
-            'collected': frozenset(),
-            'parent': None
-        }
+        return [self.get_reward(item_type) for item_type in analysis.item_types]
 
-    def reconstruct_path(self, node: dict) -> list[tuple[int, int]]:
+    def cell_rewards(self, state_space: Grid, analysis: GridAnalysis) -> np.ndarray:
         """
-        Reconstructs a path from a terminal node.
+        :param state_space: grid being searched.
+        :param analysis: analysis of the grid being searched.
+        :return: reward value of the item in every cell, 0 for cells without one.
+        """
+        rewards = np.array(self.item_rewards(analysis) + [0])
+        return rewards[state_space.item_index]  # NO_ITEM (-1) picks the trailing 0
+
+    def evaluation_rows(self, state_space: Grid, goal: tuple[int, int], heuristic) -> tuple[TableRows, TableRows]:
+        """
+        Precompute the reward-aware evaluation, reward - heuristic(cell, goal), of every cell once per search.
+
+        :param state_space: grid being searched.
+        :param goal: goal the heuristic measures to.
+        :param heuristic: heuristic of the pathfinder.
+        :return: (evaluation of each cell while its item is uncollected, heuristic of each cell), both as rows of
+                 lists indexed [row][col]. A collected cell evaluates to minus its heuristic.
+        """
+        self.analysis = GridAnalysis.for_grid(state_space)
+        table = self.analysis.heuristic_table(heuristic, goal)
+        evaluations = TableRows(self.cell_rewards(state_space, self.analysis) - table)
+        return evaluations, self.analysis.heuristic_rows(heuristic, goal)
+
+    def new_node_pool(self, cols: int) -> NodePool:
+        """
+        :param cols: Number of grid columns.
+        :return: empty node pool, storing integer scores when both rewards are integers.
+        """
+        return NodePool(cols, isinstance(self.coin_reward, int) and isinstance(self.trash_reward, int))
+
+    def build_front(self, pool: NodePool, goal_nodes: dict[int, int], max_step_limit: int) -> ParetoFront:
+        """
+        Build a Pareto front from the best goal node found for each step count.
 
-        :param node: terminal node to reconstruct path from.
-        :return: path from terminal node.
+        :param pool: Node pool the search stored its nodes in
+        :param goal_nodes: Handle of the best-scoring terminal node per step count
+        :param max_step_limit: Largest step limit the search covered
         """
-        path = []
-        while node:
-            path.append(node['pos'])
-            node = node['parent']
-        return list(reversed(path))
+        entries = [(steps, pool.scores[node], pool.path(node)) for steps, node in goal_nodes.items()]
+        return ParetoFront(max_step_limit, entries)
 
     @abstractmethod
     def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
@@ -0,0 +1,101 @@
+import numpy as np
+from core.grid_analysis import GridAnalysis
+
+
+class RewardBound:
+    """
+    Branch-and-bound pruning for reward-aware searches.
+
+    The reward a node can still collect is at most the positive reward of its uncollected items that it could visit
+    on the way to the goal within the steps it has left. An item i counts if a lower bound on the distance from the
+    node to i, plus i's distance to the goal, fits: the lower bound is the larger of the Manhattan distance and the
+    difference of the two cells' goal distances. Only items that a path from start can reach within the step limit are
+    considered, and the reachable set of each (position, steps left) is computed once and kept as a bitmask per reward
+    value, so each check costs a dict lookup and a popcount.
+
+    A node is pruned when its score plus that bound cannot beat the best goal path that is no longer than the node's
+    shortest possible arrival. Comparing against those paths only, instead of the best path overall, keeps every entry
+    of a Pareto front exact.
+    """
+    def __init__(
+            self,
+            analysis: GridAnalysis,
+            item_rewards: list[float],
+            start: tuple[int, int],
+            goal: tuple[int, int],
+            max_step_limit: int,
+            cache_size: int | None = None
+    ):
+        """
+        :param analysis: Analysis of the grid being searched
+        :param item_rewards: Reward of each item, indexed by item number
+        :param start: (row, col) start position
+        :param goal: (row, col) goal position
+        :param max_step_limit: Largest step limit the search covers
+        :param cache_size: Cap on cached reachable sets, or None for no cap
+        """
+        self.cols = analysis.cols
+        self.max_step_limit = max_step_limit
+        goal_distance = analysis.distance_field(goal)
+        self._goal_distance = goal_distance.ravel()
+        candidates = [i for i in analysis.reachable_items(start, goal, max_step_limit) if item_rewards[i] > 0]
+        self.total = sum(item_rewards[i] for i in candidates)  # Positive reward a path from start can collect
+        cells = np.array([analysis.items[i] for i in candidates], dtype=np.int64).reshape(-1, 2)
+        self._item_rows, self._item_cols = cells[:, 0], cells[:, 1]
+        self._item_goal = goal_distance[self._item_rows, self._item_cols].astype(np.int64)
+        self._item_bits = [1 << i for i in candidates]
+        rewards = np.array([item_rewards[i] for i in candidates])
+        self._groups = [(reward, rewards == reward) for reward in sorted(set(rewards.tolist()))]
+        self._reach: dict[tuple[int, int], list[tuple[float, int]]] = {}
+        self._cache_size = cache_size
+        self._best_within = [float('-inf')] * (max_step_limit + 1)  # Best goal score using at most i steps
+
+    def record(self, steps: int, score: float) -> None:
+        """
+        Record a goal path, raising the best score of every step count it fits within.
+        """
+        best_within = self._best_within
+        for i in range(steps, self.max_step_limit + 1):
+            if best_within[i] >= score:  # Non-decreasing, so later entries are at least as high
+                break
+            best_within[i] = score
+
+    def remaining(self, pos_id: int, steps: int, collected_mask: int) -> float:
+        """
+        Upper bound on the reward a node at pos_id with the given step count and collected mask can still collect.
+        """
+        if not self.total:
+            return 0
+        key = (pos_id, self.max_step_limit - steps)
+        groups = self._reach.get(key)
+        if groups is None:
+            if self._cache_size is not None and len(self._reach) >= self._cache_size:
+                self._reach.clear()
+            groups = self._reach[key] = self._reachable(pos_id, key[1])
+        return sum(reward * (mask & ~collected_mask).bit_count() for reward, mask in groups)
+
+    def prunes(self, pos_id: int, steps: int, score: float, collected_mask: int) -> bool:
+        """
+        Determine if no path through the node can beat a goal path that is already known.
+        """
+        arrival = steps + int(self._goal_distance[pos_id])
+        if arrival > self.max_step_limit:
+            return True
+        incumbent = self._best_within[arrival]
+        return incumbent != float('-inf') and score + self.remaining(pos_id, steps, collected_mask) <= incumbent
+
+    def _reachable(self, pos_id: int, steps_left: int) -> list[tuple[float, int]]:
+        """
+        Masks of the candidate items a node at pos_id could visit within steps_left steps, one per reward value.
+        """
+        row, col = divmod(pos_id, self.cols)
+        manhattan = np.abs(self._item_rows - row) + np.abs(self._item_cols - col)
+        lower = np.maximum(manhattan, np.abs(self._item_goal - int(self._goal_distance[pos_id])))
+        fits = lower + self._item_goal <= steps_left
+        groups = []
+        for reward, in_group in self._groups:
+            mask = 0
+            for j in np.flatnonzero(fits & in_group):
+                mask |= self._item_bits[j]
+            groups.append((reward, mask))
+        return groups
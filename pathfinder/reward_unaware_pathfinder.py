@@ -0,0 +1,12 @@
+from pathfinder.base_pathfinder import BasePathfinder
+
+
+class RewardUnawarePathfinder(BasePathfinder):
+    """
+    Base class for pathfinding algorithms that find shortest paths and ignore game object rewards.
+    """
+    def parameters(self) -> tuple:
+        """
+        Reward values do not affect reward-unaware search.
+        """
+        return ()
@@ -0,0 +1,217 @@
+import heapq
+from itertools import count
+from pathfinder.reward_astar_pathfinder import RewardAStarPathfinder
+from pathfinder.base_pathfinder import INTERRUPT_CHECK_INTERVAL
+from pathfinder.node_pool import NO_PARENT
+from pathfinder.reward_bound import RewardBound
+from core.grid import Grid, NO_ITEM
+from core.grid_analysis import GridAnalysis
+
+MAX_NODES = 100_000  # Default cap on stored search nodes
+NO_VALUE = float('-inf')
+
+
+class SMAStarPathfinder(RewardAStarPathfinder):
+    """
+    Memory-bounded reward-aware search (SMA*-style) that stores at most max_nodes nodes.
+    """
+    supports_front = False  # Stops at the best path for its own step limit
+
+    def __init__(
+            self,
+            step_limit,
+            coin_reward,
+            trash_reward,
+            heuristic=None,
+            reward_weight=1.0,
+            max_nodes: int = MAX_NODES
+    ):
+        """
+        :param max_nodes: Cap on search nodes kept in memory
+        """
+        super().__init__(step_limit, coin_reward, trash_reward, heuristic, reward_weight)
+        self.max_nodes = max_nodes
+        self.evictions = 0
+
+    def parameters(self) -> tuple:
+        """
+        The node cap does not change the best score, but it can change which of several equally good paths is found.
+        """
+        return super().parameters() + (self.max_nodes,)
+
+    def search(self, state_space: Grid, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Compute a path from start to goal in the given state space.
+        """
+        self.final_path = []
+        self.evictions = 0
+        self.analysis = GridAnalysis.for_grid(state_space)
+        goal_distance = self.analysis.distance_field(goal)
+        if goal_distance[start] > self.step_limit:  # Goal cannot be reached in time
+            return self.final_path
+        capacity = max(self.max_nodes, 4 * (self.step_limit + 1) + 1)  # Enough for one path and its siblings
+        self._start_search(state_space, start, goal, goal_distance, capacity)
+        pool = self._pool
+        while self._open:
+            _, _, _, node, version = heapq.heappop(self._open)
+            if version != self._versions[node]:  # Skip stale entries
+                continue
+            self.states_explored += 1
+            if not self.states_explored % INTERRUPT_CHECK_INTERVAL:
+                self.check_interrupt()
+            if pool.position(node) == goal:  # Goal test: no open node can beat its score
+                self.final_path = pool.path(node)
+                return self.final_path
+            self._expand(node)
+            while len(pool) > capacity and self._evict_worst_leaf():
+                self.evictions += 1
+            if len(self._open) + len(self._leaves) > 4 * capacity:
+                self._compact()
+        return self.final_path
+
+    def _start_search(self, state_space, start, goal, goal_distance, capacity: int) -> None:
+        """
+        Reset the search tree to the root node.
+        """
+        self._state_space, self._goal, self._goal_distance = state_space, goal, goal_distance
+        self._item_index = state_space.item_index
+        self._item_rewards = self.item_rewards(self.analysis)
+        self._bound = RewardBound(self.analysis, self._item_rewards, start, goal, self.step_limit, cache_size=capacity)
+        self._pool = self.new_node_pool(state_space.cols)
+        # Per-handle columns alongside the pool. Masks are kept per node, not interned, so evicted masks are freed
+        self._masks: list[int] = []
+        self._values: list[float] = []  # Backed-up optimistic value
+        self._forgotten: list[float] = []  # Best value among evicted children, NO_VALUE if none
+        self._children: list[list[int] | None] = []  # None until expanded
+        self._versions: list[int] = []
+        self._visited: dict[tuple[int, int], int] = {}  # (collected mask, position id) -> live node
+        self._open: list = []  # Max-heap on (value, steps) of nodes to expand
+        self._leaves: list = []  # Min-heap on (value, steps) of eviction candidates
+        self._counter = count()
+        root = self._add_node(start, 0, 0, 0, NO_PARENT, self._bound.total)
+        self._touch(root)
+
+    def _add_node(self, pos: tuple[int, int], score: float, steps: int, mask: int, parent: int, cap: float) -> int:
+        """
+        Store a node valued at its optimistic score, capped by its parent's value (pathmax).
+        """
+        pool = self._pool
+        node = pool.add(pos, score, steps, 0, parent)  # Mask id unused, see self._masks
+        pos_id = pool.pos_ids[node]
+        if pos == self._goal:  # Goal nodes are not expanded, so their value is their score
+            value = score
+        else:
+            value = min(score + self._bound.remaining(pos_id, steps, mask), cap)
+        columns = (self._masks, self._values, self._forgotten, self._children, self._versions)
+        if node == len(self._masks):
+            for column, initial in zip(columns, (mask, value, NO_VALUE, None, 0)):
+                column.append(initial)
+        else:
+            self._masks[node], self._values[node], self._forgotten[node] = mask, value, NO_VALUE
+            self._children[node] = None
+        self._visited[(mask, pos_id)] = node
+        return node
+
+    def _touch(self, node: int) -> None:
+        """
+        Invalidate a node's heap entries and push it onto the heaps it now belongs to.
+        """
+        self._versions[node] += 1
+        version = self._versions[node]
+        value, steps = self._values[node], self._pool.steps[node]
+        children = self._children[node]
+        if children is None or self._forgotten[node] != NO_VALUE:  # Unexpanded, or has children to regenerate
+            heapq.heappush(self._open, (-value, -steps, next(self._counter), node, version))
+        if not children and self._pool.parents[node] != NO_PARENT:  # Leaves other than the root can be evicted
+            heapq.heappush(self._leaves, (value, steps, next(self._counter), node, version))
+
+    def _expand(self, node: int) -> None:
+        """
+        Generate the successors of a node that are not already stored, then back up its value.
+        """
+        pool = self._pool
+        state_space, goal, goal_distance = self._state_space, self._goal, self._goal_distance
+        steps, score, collected_mask = pool.steps[node], pool.scores[node], self._masks[node]
+        children = self._children[node] or []
+        present = {(self._masks[child], pool.pos_ids[child]) for child in children}
+        for neighbor in state_space.get_adjacent(*pool.position(node)):
+            if steps + 1 + int(goal_distance[neighbor]) > self.step_limit:  # Skip if goal is out of reach
+                continue
+            item = int(self._item_index[neighbor])
+            new_score = score
+            new_mask = collected_mask
+            if item != NO_ITEM and not (collected_mask >> item) & 1:  # Add reward if not yet collected
+                new_score += self._item_rewards[item]
+                new_mask = collected_mask | (1 << item)
+            key = (new_mask, neighbor[0] * state_space.cols + neighbor[1])
+            if key in present:
+                continue
+            other = self._visited.get(key)
+            if other is not None and pool.scores[other] >= new_score and pool.steps[other] <= steps + 1:
+                continue  # Dominated by a stored node
+            child = self._add_node(neighbor, new_score, steps + 1, new_mask, node, self._values[node])
+            children.append(child)
+            self._touch(child)
+        self._children[node] = children
+        self._forgotten[node] = NO_VALUE  # Every forgotten child was regenerated or is dominated
+        self._backup(node)
+
+    def _backup(self, node: int) -> None:
+        """
+        Lower a node's value to the best of its children and forgotten children, propagating up the tree. Nodes left
+        with nothing to search are removed.
+        """
+        while node != NO_PARENT:
+            children = self._children[node]
+            best = max((self._values[child] for child in children), default=NO_VALUE)
+            best = max(best, self._forgotten[node])
+            parent = self._pool.parents[node]
+            if best == NO_VALUE:  # Dead end
+                self._remove(node)
+                if parent != NO_PARENT:
+                    self._children[parent].remove(node)
+            elif best < self._values[node] or not children:
+                self._values[node] = best
+                self._touch(node)
+            else:
+                self._touch(node)
+                return
+            node = parent
+
+    def _evict_worst_leaf(self) -> bool:
+        """
+        Evict the lowest-valued leaf, remembering its value in its parent.
+
+        :return: False if no leaf can be evicted
+        """
+        while self._leaves:
+            _, _, _, leaf, version = heapq.heappop(self._leaves)
+            if version != self._versions[leaf]:  # Skip stale entries
+                continue
+            parent = self._pool.parents[leaf]
+            self._children[parent].remove(leaf)
+            self._forgotten[parent] = max(self._forgotten[parent], self._values[leaf])
+            self._remove(leaf)
+            self._touch(parent)
+            return True
+        return False
+
+    def _compact(self) -> None:
+        """
+        Drop stale heap entries, so the heaps stay proportional to the stored nodes.
+        """
+        versions = self._versions
+        self._open = [entry for entry in self._open if entry[4] == versions[entry[3]]]
+        self._leaves = [entry for entry in self._leaves if entry[4] == versions[entry[3]]]
+        heapq.heapify(self._open)
+        heapq.heapify(self._leaves)
+
+    def _remove(self, node: int) -> None:
+        """
+        Release a node's slot and drop its heap and duplicate check entries.
+        """
+        self._versions[node] += 1
+        key = (self._masks[node], self._pool.pos_ids[node])
+        if self._visited.get(key) == node:
+            del self._visited[key]
+        self._pool.release(node)
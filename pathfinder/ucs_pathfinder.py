@@ -1,9 +1,10 @@
-import heapq
-from pathfinder.base_pathfinder import BasePathfinder
+from pathfinder.base_pathfinder import INTERRUPT_CHECK_INTERVAL
+from pathfinder.reward_unaware_pathfinder import RewardUnawarePathfinder
+from pathfinder.frontier import Frontier
 from core.grid import Grid
 
 
-class UCSPathfinder(BasePathfinder):
+class UCSPathfinder(RewardUnawarePathfinder):
     """
     Uniform Cost Search pathfinder.
     """
@@ -14,12 +15,16 @@ class UCSPathfinder(BasePathfinder):
         """
         Compute a path from start to goal in the given state space.
         """
-        frontier = []
-        heapq.heappush(frontier, (0, start, [start]))  # Priority queue is frontier
+        frontier = Frontier()
+        frontier.push(0, [start])  # Priority queue is frontier
         visited = {}
         while frontier:
             self.states_explored += 1
-            cost_so_far, current, path = heapq.heappop(frontier)  # Pop node from frontier
+            if not self.states_explored % INTERRUPT_CHECK_INTERVAL:
+                self.check_interrupt()
+            path = frontier.pop()  # Pop node from frontier
+            current = path[-1]
+            cost_so_far = len(path) - 1  # Every step costs 1
             if len(path) - 1 > self.step_limit:  # Skip invalid nodes
                 continue
             if current in visited and cost_so_far >= visited[current]:  # Skip if state is not improvement
@@ -31,6 +36,6 @@ class UCSPathfinder(BasePathfinder):
             for neighbor in state_space.get_adjacent(*current):  # Push neighbors to pqueue
                 total_cost = cost_so_far + 1
                 new_path = path + [neighbor]
-                heapq.heappush(frontier, (total_cost, neighbor, new_path))
+                frontier.push(total_cost, new_path)
         self.final_path = []
         return []
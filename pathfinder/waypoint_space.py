@@ -0,0 +1,133 @@
+import time
+import numpy as np
+from core.bitboard import bfs_distance_field
+from core.grid import Grid
+from core.grid_analysis import GridAnalysis
+
+MAX_ITEMS = 128  # Most items in a waypoint space, which holds a distance field per item and legs cubic in items
+MAX_FIELD_CELLS = 1 << 25  # Most distance field cells held across the items of a waypoint space
+
+
+class WaypointSpace:
+    """
+    Paths from start to goal through a sequence of item waypoints, each leg a fixed shortest path.
+
+    Nodes 0 to size - 1 are items a path within the step limit can collect (see GridAnalysis.reachable_items), at most
+    max_items of them with the shortest detours, node size is start and node size + 1 is goal. A path is a list of
+    item nodes. Paths end at the goal, so no leg passes through it on the way to another node. Items a leg passes on
+    the way are collected too, so the items each leg crosses are found the first time the leg is used and batches of
+    paths are scored with NumPy, exactly when every reachable item is in the space. Memory grows with the cube of the
+    number of items, and setup computes one distance field per item, so both are capped.
+    """
+    def __init__(
+            self,
+            state_space: Grid,
+            analysis: GridAnalysis,
+            start: tuple[int, int],
+            goal: tuple[int, int],
+            item_rewards: list,
+            step_limit: int,
+            max_items: int = MAX_ITEMS,
+            deadline: float | None = None,
+            check_interrupt=None
+    ):
+        """
+        :param item_rewards: Reward of each item, indexed by item number
+        :param max_items: Most items kept, preferring those with the shortest detour from start to goal
+        :param deadline: time.perf_counter() value after which no more items are added, or None
+        :param check_interrupt: Called before each distance field is computed, to raise if the search is interrupted
+        """
+        self.state_space = state_space
+        self.analysis = analysis
+        self.step_limit = step_limit
+        goal_field = analysis.distance_field(goal)
+        start_field = analysis.distance_field(start, blocked=goal)
+        items = analysis.reachable_items(start, goal, step_limit)
+        detours = [int(start_field[analysis.items[i]]) + int(goal_field[analysis.items[i]]) for i in items]
+        items = [items[i] for i in np.argsort(detours, kind='stable')]
+        max_items = min(max_items, MAX_FIELD_CELLS // (analysis.rows * analysis.cols))
+        fields = []
+        for item in items[:max_items]:  # Each item keeps its own field, so legs never refetch it
+            if deadline is not None and fields and time.perf_counter() >= deadline:
+                break
+            if check_interrupt is not None:
+                check_interrupt()
+            fields.append(bfs_distance_field(analysis.walkable, analysis.items[item], blocked=goal))
+        self.item_numbers = items[:len(fields)]
+        self.size = len(self.item_numbers)
+        self.start = self.size
+        self.goal = self.size + 1
+        self.cells = [analysis.items[i] for i in self.item_numbers] + [start, goal]
+        self._fields = fields + [start_field, goal_field]  # Step distance from every cell to each node
+        nodes = len(self.cells)
+        rows, cols = np.array(self.cells).T
+        self.distances = np.empty((nodes, nodes), dtype=np.int64)
+        for node in range(nodes):
+            self.distances[:, node] = self._fields[node][rows, cols]
+        self.rewards = np.array([item_rewards[i] for i in self.item_numbers], dtype=float)
+        self._nodes = {item: node for node, item in enumerate(self.item_numbers)}
+        self._crossed = np.zeros((nodes, nodes, self.size), dtype=bool)  # Items crossed by each leg
+        self._known = np.eye(nodes, dtype=bool)  # Legs whose crossed items have been found
+
+    def pack(self, paths: list[list[int]], width: int | None = None) -> np.ndarray:
+        """
+        Pack paths into a node array with one row per path: start, the waypoints, then goal repeated to the width.
+
+        :param width: Columns of the array, at least the longest path plus two
+        """
+        width = width or max(map(len, paths), default=0) + 2
+        packed = np.full((len(paths), width), self.goal, dtype=np.int64)
+        packed[:, 0] = self.start
+        for row, path in enumerate(paths):
+            packed[row, 1:len(path) + 1] = path
+        return packed
+
+    def evaluate(self, packed: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Score a batch of packed paths.
+
+        :return: (steps, score) arrays, one entry per path
+        """
+        a, b = packed[:, :-1], packed[:, 1:]
+        unknown = ~self._known[a, b]
+        if unknown.any():
+            for leg in np.unique(a[unknown] * len(self.cells) + b[unknown]):
+                self._learn(*divmod(int(leg), len(self.cells)))
+        steps = self.distances[a, b].sum(axis=1)
+        scores = self._crossed[a, b].any(axis=1) @ self.rewards
+        return steps, scores
+
+    def expand(self, path: list[int]) -> list[tuple[int, int]]:
+        """
+        Get the cells of a path from start to goal.
+        """
+        cells = [self.cells[self.start]]
+        nodes = [self.start] + list(path) + [self.goal]
+        for a, b in zip(nodes, nodes[1:]):
+            cells += self._leg(a, b)
+        return cells
+
+    def _leg(self, a: int, b: int) -> list[tuple[int, int]]:
+        """
+        Get the cells of the shortest path from node a to node b, excluding a. Each step goes to the first neighbor
+        one step closer to b, so a leg is always the same path.
+        """
+        field = self._fields[b]
+        pos, target = self.cells[a], self.cells[b]
+        cells = []
+        while pos != target:
+            closer = int(field[pos]) - 1
+            pos = next(n for n in self.state_space.get_adjacent(*pos) if int(field[n]) == closer)
+            cells.append(pos)
+        return cells
+
+    def _learn(self, a: int, b: int) -> None:
+        """
+        Find the items the leg from node a to node b crosses.
+        """
+        item_index = self.state_space.item_index
+        for pos in self._leg(a, b):
+            node = self._nodes.get(int(item_index[pos]))
+            if node is not None:
+                self._crossed[a, b, node] = True
+        self._known[a, b] = True
@@ -0,0 +1,161 @@
+import atexit
+import copy
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait
+from core.cancellation import SearchInterrupted
+from core.grid import Grid
+
+POLL_INTERVAL = 0.01  # Seconds between interrupt checks while waiting on workers
+DEADLINE_MARGIN = 0.05  # Seconds before a deadline that workers stop, leaving time to return their results
+
+_executors: dict[int, ProcessPoolExecutor] = {}
+
+
+def default_workers() -> int:
+    """
+    Get the number of worker processes used when a pathfinder does not set one.
+    """
+    return os.cpu_count() or 1
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Get a process pool with the given number of workers. Pools are started on first use and kept for later searches,
+    so only the first search pays for process startup.
+    """
+    executor = _executors.get(workers)
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        _executors[workers] = executor
+    return executor
+
+
+@atexit.register
+def shutdown() -> None:
+    """
+    Stop every pool started by get_executor.
+    """
+    for executor in _executors.values():
+        executor.shutdown(cancel_futures=True)
+    _executors.clear()
+
+
+def worker_seeds(seed: int | None, workers: int) -> list[int]:
+    """
+    Get independent seeds for each worker, reproducible when seed is set.
+    """
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(workers)]
+
+
+def worker_shares(total: int | None, workers: int) -> list[int | None]:
+    """
+    Split a total number of iterations evenly across workers, or give every worker None if there is no total.
+    """
+    if total is None:
+        return [None] * workers
+    base, extra = divmod(total, workers)
+    return [base + (i < extra) for i in range(workers)]
+
+
+def remaining_budget(pathfinder, time_budget: float | None) -> float | None:
+    """
+    Cap a time budget at the pathfinder's deadline, less DEADLINE_MARGIN. Workers cannot see the deadline, so they
+    stop just before it instead.
+    """
+    if pathfinder.deadline is None:
+        return time_budget
+    remaining = max(pathfinder.deadline - time.perf_counter() - DEADLINE_MARGIN, 0.0)
+    return remaining if time_budget is None else min(time_budget, remaining)
+
+
+def portable_grid(grid: Grid) -> Grid:
+    """
+    Get a grid that pickles cheaply: shared grids pickle as their handle, other grids are copied without their caches.
+    """
+    if grid.handle is not None:
+        return grid
+    portable = Grid(grid.rows, grid.cols, cells=grid.cells)
+    portable.agent_x_y = grid.agent_x_y
+    portable.goal_x_y = grid.goal_x_y
+    return portable
+
+
+def worker_copy(pathfinder):
+    """
+    Get a copy of a pathfinder that runs in a single process and pickles without its search state.
+    """
+    clone = copy.copy(pathfinder)
+    clone.workers = 1
+    clone.states_explored = 0
+    clone.final_path = []
+    clone.analysis = None
+    clone.set_interrupt()
+    return clone
+
+
+def best_result(results: list[tuple]) -> tuple[float | None, list[tuple[int, int]]]:
+    """
+    Merge (score, path, iterations, states explored) results into the highest-scoring path, the shortest on ties.
+    """
+    best_score, best_path = None, []
+    for score, path, _, _ in results:
+        if path and (best_score is None or (score, -len(path)) > (best_score, -len(best_path))):
+            best_score, best_path = score, path
+    return best_score, best_path
+
+
+def run_search(pathfinder, method: str, state_space: Grid, start, goal, iterations: int | None) -> tuple[list, int]:
+    """
+    Run pathfinder.<method>(state_space, start, goal, seed, time_budget, iterations) on every worker, each with its
+    own seed and share of the iterations, and merge the results with best_result. One worker runs in this process.
+
+    The method returns (score, path, iterations run, states explored). The time budget is capped at the
+    pathfinder's deadline (see remaining_budget). If the search is interrupted, the best path of the workers that
+    finished is attached to SearchInterrupted.
+
+    :return: (best path, iterations run across all workers)
+    """
+    time_budget = remaining_budget(pathfinder, pathfinder.time_budget)
+    workers = pathfinder.workers if iterations is None else max(min(pathfinder.workers, iterations), 1)
+    seeds = worker_seeds(pathfinder.seed, workers)
+    shares = worker_shares(iterations, workers)
+    if workers == 1:
+        results = [getattr(pathfinder, method)(state_space, start, goal, seeds[0], time_budget, shares[0])]
+    else:
+        clone = worker_copy(pathfinder)
+        grid = portable_grid(state_space)
+        tasks = [(clone, method, grid, start, goal, seed, time_budget, share) for seed, share in zip(seeds, shares)]
+        results = run_tasks(pathfinder, _run_method, tasks)
+        pathfinder.states_explored += sum(states for _, _, _, states in results)
+    return best_result(results)[1], sum(runs for _, _, runs, _ in results)
+
+
+def _run_method(pathfinder, method: str, *args) -> tuple:
+    """
+    Run a pathfinder method in a worker process.
+    """
+    return getattr(pathfinder, method)(*args)
+
+
+def run_tasks(pathfinder, fn, tasks: list[tuple]) -> list:
+    """
+    Run fn(*task) for every task in a shared process pool, one worker per task, and return the results in task order.
+
+    The pathfinder's cancellation token and deadline are checked while waiting. If it is interrupted, queued tasks are
+    cancelled, the best path of the tasks that finished (see best_result) is attached to SearchInterrupted and it is
+    raised; tasks already running finish in the background.
+    """
+    executor = get_executor(len(tasks))
+    futures = [executor.submit(fn, *task) for task in tasks]
+    try:
+        while wait(futures, timeout=POLL_INTERVAL).not_done:
+            pathfinder.check_interrupt()
+    except SearchInterrupted as interrupted:
+        for future in futures:
+            future.cancel()
+        finished = [f.result() for f in futures if f.done() and not f.cancelled() and f.exception() is None]
+        interrupted.path = best_result(finished)[1]
+        raise
+    return [future.result() for future in futures]
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from core.grid import Grid
+from core.map_loader import decode_grid
+from core.search_planner import SearchPlanner
+from pathfinder import registry
+
+GRID_CACHE_SIZE = 32
+
+_grid_cache: OrderedDict[str, Grid] = OrderedDict()  # Per-worker grids, reused across batches
+
+
+def grid_key(rows: list) -> str:
+    """
+    Content key for an encoded grid.
+    """
+    return hashlib.blake2b(json.dumps(rows, separators=(",", ":")).encode(), digest_size=16).hexdigest()
+
+
+def _warm_worker(algorithms: list[str]) -> None:
+    """
+    Import pathfinders up front so the first request does not pay for it.
+    """
+    for algorithm in algorithms:
+        registry.get_pathfinder(algorithm)
+
+
+def _get_grid(key: str, rows: list) -> Grid:
+    """
+    Get a decoded grid from the worker cache.
+    """
+    grid = _grid_cache.get(key)
+    if grid is None:
+        grid = decode_grid(rows)
+        _grid_cache[key] = grid
+        if len(_grid_cache) > GRID_CACHE_SIZE:
+            _grid_cache.popitem(last=False)
+    else:
+        _grid_cache.move_to_end(key)
+    return grid
+
+
+def plan_group(key: str, rows: list, queries: list[dict]) -> list[dict]:
+    """
+    Plan a group of queries that share one grid. Runs in a worker process.
+    """
+    grid = _get_grid(key, rows)
+    results = []
+    for query in queries:
+        try:
+            start = tuple(query.get('start') or grid.agent_x_y or ())
+            goal = tuple(query.get('goal') or grid.goal_x_y or ())
+            if not start or not goal:
+                raise ValueError("Request has no start or goal")
+            pathfinder = registry.get_pathfinder(query.get('algorithm', "ASTAR"))(
+                query.get('step_limit', 20),
+                query.get('coin_reward', 0),
+                query.get('trash_reward', 0)
+            )
+            planner = SearchPlanner(pathfinder)
+            path = planner.plan(grid, start, goal, timeout=query.get('timeout'))
+            results.append({
+                'success': bool(path),
+                'status': str(planner.last_status),
+                'path': path,
+                'states_explored': pathfinder.states_explored,
+                'compute_time': planner.last_compute_time
+            })
+        except Exception as e:
+            results.append({'success': False, 'error': str(e)})
+    return results
+
+
+class PlanRequest:
+    """
+    Queued plan request awaiting a result.
+    """
+    def __init__(self, rows: list, query: dict):
+        self.rows = rows
+        self.key = grid_key(rows)
+        self.query = query
+        self.enqueued_at = time.perf_counter()
+        self.queue_depth = 0
+        self.future: Future = Future()
+
+
+class PlanBatcher:
+    """
+    Collects plan requests, groups those that share a grid and dispatches each group to a pool of warm workers.
+    """
+    def __init__(
+            self,
+            workers: int | None = None,
+            max_batch: int = 64,
+            batch_window: float = 0.002,
+            warm_algorithms: list[str] | None = None
+    ):
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_warm_worker,
+            initargs=(warm_algorithms or registry.available(),)
+        )
+        self.requests: queue.Queue[PlanRequest | None] = queue.Queue()
+        self.in_flight = 0
+        self.completed = 0
+        self.total_latency = 0.0
+        self._lock = threading.Lock()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatcher.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of requests waiting to be dispatched.
+        """
+        return self.requests.qsize()
+
+    def submit(self, rows: list, query: dict) -> Future:
+        """
+        Queue a plan request.
+
+        :param rows: Encoded grid rows, as written by Report
+        :param query: start, goal, algorithm, step_limit, coin_reward, trash_reward and timeout (all optional)
+        :return: Future resolving to the result dict
+        """
+        request = PlanRequest(rows, query)
+        request.queue_depth = self.queue_depth
+        self.requests.put(request)
+        return request.future
+
+    def plan(self, rows: list, query: dict) -> dict:
+        """
+        Queue a plan request and wait for its result.
+        """
+        return self.submit(rows, query).result()
+
+    def stats(self) -> dict:
+        """
+        Get queue and latency statistics.
+        """
+        with self._lock:
+            return {
+                'queue_depth': self.queue_depth,
+                'in_flight': self.in_flight,
+                'completed': self.completed,
+                'avg_latency': self.total_latency / self.completed if self.completed else 0.0
+            }
+
+    def _collect_batch(self) -> list[PlanRequest] | None:
+        """
+        Block for one request, then gather more for up to batch_window seconds.
+        """
+        first = self.requests.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.batch_window
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self.requests.get(timeout=max(timeout, 0)) if timeout > 0 else self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                self.requests.put(None)  # Stop after this batch
+                break
+            batch.append(request)
+        return batch
+
+    def _dispatch_loop(self) -> None:
+        """
+        Group batched requests by grid and dispatch each group to the pool.
+        """
+        while (batch := self._collect_batch()) is not None:
+            groups: dict[str, list[PlanRequest]] = defaultdict(list)
+            for request in batch:
+                groups[request.key].append(request)
+            for key, group in groups.items():
+                with self._lock:
+                    self.in_flight += len(group)
+                future = self.pool.submit(plan_group, key, group[0].rows, [r.query for r in group])
+                future.add_done_callback(lambda f, g=group: self._resolve(g, f))
+
+    def _resolve(self, group: list[PlanRequest], future: Future) -> None:
+        """
+        Attach latency and batching info to results and complete the request futures.
+        """
+        now = time.perf_counter()
+        try:
+            results = future.result()
+        except Exception as e:
+            results = [{'success': False, 'error': str(e)} for _ in group]
+        with self._lock:
+            self.in_flight -= len(group)
+            for request, result in zip(group, results):
+                latency = now - request.enqueued_at
+                self.completed += 1
+                self.total_latency += latency
+                result.update({'latency': latency, 'queue_depth': request.queue_depth, 'batch_size': len(group)})
+        for request, result in zip(group, results):
+            request.future.set_result(result)
+
+    def close(self) -> None:
+        """
+        Stop dispatching and shut down the worker pool.
+        """
+        self.requests.put(None)
+        self._dispatcher.join()
+        self.pool.shutdown()
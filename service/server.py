@@ -0,0 +1,149 @@
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from service.batcher import PlanBatcher
+
+
+def decode_request(data: bytes) -> dict:
+    """
+    Decode a request body.
+
+    :raises ValueError: if it is not valid JSON or not a JSON object
+    """
+    try:
+        request = json.loads(data)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    if not isinstance(request, dict):
+        raise ValueError(f"Request must be a JSON object, got {type(request).__name__}")
+    return request
+
+
+def handle_request(batcher: PlanBatcher, request: dict) -> dict:
+    """
+    Plan a decoded request, or return statistics.
+
+    Requests are JSON objects with a 'grid' (rows of Report cell codes) and optional 'start', 'goal', 'algorithm',
+    'step_limit', 'coin_reward' and 'trash_reward'. A request of {"stats": true} returns queue statistics.
+    """
+    if request.get('stats'):
+        return batcher.stats()
+    if 'grid' not in request:
+        return {'success': False, 'error': "Request has no grid"}
+    query = {k: v for k, v in request.items() if k != 'grid'}
+    return batcher.plan(request['grid'], query)
+
+
+class PlanHTTPHandler(BaseHTTPRequestHandler):
+    """
+    Localhost HTTP front end.
+    """
+    server: "PlanHTTPServer"
+
+    def _send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send_json(200, self.server.batcher.stats())
+        else:
+            self._send_json(404, {'error': "Not found"})
+
+    def do_POST(self) -> None:
+        if self.path != "/plan":
+            self._send_json(404, {'error': "Not found"})
+            return
+        try:
+            request = decode_request(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        self._send_json(200, handle_request(self.server.batcher, request))
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Latency is reported per request instead of logged per hit
+
+
+class PlanHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: tuple[str, int], batcher: PlanBatcher):
+        super().__init__(address, PlanHTTPHandler)
+        self.batcher = batcher
+
+
+class PlanStreamHandler(socketserver.StreamRequestHandler):
+    """
+    Unix socket front end speaking newline-delimited JSON.
+    """
+    server: "PlanUnixServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = decode_request(line)
+            except ValueError as e:
+                response = {'success': False, 'error': str(e)}
+            else:
+                response = handle_request(self.server.batcher, request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class PlanUnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, path: str, batcher: PlanBatcher):
+        super().__init__(path, PlanStreamHandler)
+        self.batcher = batcher
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m service.server",
+        description="Run the Grid Runner planning service."
+    )
+    parser.add_argument("--unix", help="Serve on this Unix socket path instead of HTTP")
+    parser.add_argument("--port", type=int, default=8765, help="Localhost HTTP port (default: 8765)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-batch", type=int, default=64, help="Maximum requests per batch (default: 64)")
+    parser.add_argument("--batch-window", type=float, default=0.002,
+                        help="Seconds to wait for more requests before dispatching a batch (default: 0.002)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    batcher = PlanBatcher(workers=args.workers, max_batch=args.max_batch, batch_window=args.batch_window)
+    if args.unix:
+        if os.path.exists(args.unix):
+            os.remove(args.unix)
+        server = PlanUnixServer(args.unix, batcher)
+    else:
+        server = PlanHTTPServer(("127.0.0.1", args.port), batcher)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+
+
+if __name__ == '__main__':
+    main()